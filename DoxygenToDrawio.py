@@ -12,16 +12,904 @@ Supports multiple programming languages and project types.
 
 import os
 import re
-import glob
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import mmap
+
 import argparse
 import sys
-import subprocess
-import webbrowser
-import shutil
-import tempfile
-from pathlib import Path
+import functools
+import heapq
+from collections import defaultdict, deque
+# subprocess, shutil, webbrowser, concurrent.futures, hashlib, json and the
+# XML tree library are all imported lazily inside the few functions that
+# need them; their dependency graphs dominate cold-start import time and
+# paths like --help or --find-dot never touch them
+
+# Populated by _load_etree on first use; only the --safe-xml tree writer
+# builds Elements - the default emitter writes text straight to the file
+ET = None
+_USING_LXML = False
+
+
+def _load_etree():
+    """Import the XML tree library on first use, preferring lxml when
+    available: it pretty-prints during serialization, so no second pass
+    over the tree is needed"""
+    global ET, _USING_LXML
+    if ET is None:
+        try:
+            from lxml import etree as ET
+            _USING_LXML = True
+        except ImportError:
+            import xml.etree.ElementTree as ET
+
+
+def _indent_tree(elem, level=0):
+    """In-place two-space indenter for Python <3.9 (no ET.indent)"""
+    pad = '\n' + '  ' * level
+    if len(elem):
+        if not elem.text or not elem.text.strip():
+            elem.text = pad + '  '
+        for child in elem:
+            _indent_tree(child, level + 1)
+            if not child.tail or not child.tail.strip():
+                child.tail = pad + '  '
+        if not child.tail or child.tail == pad + '  ':
+            child.tail = pad
+    if level and (not elem.tail or not elem.tail.strip()):
+        elem.tail = pad
+
+# Precompiled patterns for label cleaning (hot path - called once per node)
+_PATH_PREFIX_RE1 = re.compile(r'[^/]+/(?:Core/(?:Inc|Src)/|src/|include/|lib/|bin/|Source/|Headers/)')
+_PATH_PREFIX_RE2 = re.compile(r'(?:\.\./)*/(?:src/|include/|lib/|bin/|Source/|Headers/)')
+_PATH_PREFIX_RE3 = re.compile(r'.*/(?:src/|include/|lib/|bin/|Source/|Headers/)/')
+_FILE_EXT_RE = re.compile(r'\.(c|h|cpp|hpp|cc|cxx|c\+\+|py|pyx|pyi|java|js|ts|jsx|tsx|go|rs|swift|m|mm|cs|php|rb|pl|sh|asm|s)$')
+_MULTI_UNDERSCORE_RE = re.compile(r'[_]{2,}')
+
+# Common verb prefixes stripped before comparing two labels for similarity
+_COMMON_PREFIX_RE = re.compile(r'(?:get|set|is|has|do|handle|process|init|setup|create|delete|update)_')
+
+# Splits labels into tokens for keyword classification ('__main__' -> 'main')
+_TOKEN_RE = re.compile(r'[_\W]+')
+
+def _build_keyword_map(tiers):
+    """Flatten (score, keywords) tiers into one dict; on duplicate keywords
+    the first-listed tier wins"""
+    mapping = {}
+    for score, keywords in tiers:
+        for keyword in keywords:
+            mapping.setdefault(keyword, score)
+    return mapping
+
+# Execution priority per keyword (higher = earlier in execution sequence)
+_EXECUTION_PRIORITY = _build_keyword_map([
+    (100, ('main',)),
+    (90, ('constructor',)),
+    (80, ('setup', 'initialize', 'init', 'config')),
+    (70, ('start', 'begin', 'run', 'execute')),
+    (60, ('process', 'handle', 'update', 'loop')),
+    (50, ('read', 'input', 'receive', 'get')),
+    (45, ('write', 'output', 'send', 'transmit')),
+    (40, ('calculate', 'compute', 'transform')),
+    (35, ('validate', 'check', 'verify')),
+    (30, ('save', 'store', 'persist')),
+    (20, ('cleanup', 'close', 'finalize', 'destroy')),
+    (15, ('error', 'fail', 'exception', 'abort')),
+    (10, ('test', 'debug', 'trace')),
+    (5, ('helper', 'utility', 'util')),
+])
+
+# Functional-group classification, checked in order (first match wins)
+_FUNCTION_GROUPS = (
+    ('entry', frozenset(('main', 'init', 'constructor', 'setup', 'initialize'))),
+    ('error', frozenset(('error', 'fail', 'exception', 'abort', 'catch'))),
+    ('cleanup', frozenset(('cleanup', 'close', 'finalize', 'destroy', 'delete'))),
+    ('io', frozenset(('read', 'write', 'input', 'output', 'send', 'receive'))),
+    ('processing', frozenset(('process', 'calculate', 'compute', 'transform', 'parse'))),
+    ('utility', frozenset(('helper', 'utility', 'util', 'get', 'set'))),
+)
+
+def _build_tier_scanner(tiers):
+    """Compile (name, keywords) tiers into one zero-width alternation regex.
+
+    Each alternative is a lookahead, so one finditer pass reports every
+    tier whose keyword occurs anywhere in the label without the matches
+    consuming each other; ties at the same position go to the
+    earlier-listed (higher-priority) tier.
+    """
+    pattern = '|'.join(
+        f'(?=(?P<{name}>{"|".join(map(re.escape, keywords))}))'
+        for name, keywords in tiers
+    )
+    return re.compile(pattern)
+
+# Node styling tiers in priority order; one scan replaces the cascading
+# per-keyword substring chains in the font-size and style methods
+_NODE_TIER_RE = _build_tier_scanner((
+    ('main', ('main', '__main__', 'main()', 'int main')),
+    ('ctor', ('__init__', 'constructor', 'destructor', '~', 'setup', 'start', 'begin', 'run')),
+    ('config', ('init', 'config', 'configure', 'initialize')),
+    ('error', ('error', 'fail', 'exception', 'abort', 'throw', 'catch', 'except')),
+    ('test', ('test', 'unittest', 'pytest', 'assert', 'check')),
+    ('io', ('read', 'write', 'send', 'receive', 'transmit', 'input', 'output', 'print', 'cout', 'cin')),
+    ('timing', ('timer', 'delay', 'wait', 'sleep', 'time', 'clock')),
+    ('accessor', ('get', 'set', 'property', 'getter', 'setter', 'accessor')),
+))
+
+@functools.lru_cache(maxsize=None)
+def _node_style_tiers(label):
+    """Frozenset of styling tiers matched by one label; cached (including
+    the lowercasing) so each label is scanned once across the pipeline"""
+    return frozenset(m.lastgroup for m in _NODE_TIER_RE.finditer(label.lower()))
+
+# Per-consumer tier priorities: each walks the tiers it cares about in
+# order and takes the first one present in the label's tier set
+_FONT_SIZE_TIERS = (
+    ('main', 12),   # Main functions get larger font
+    ('ctor', 11),
+    ('error', 11),
+    ('test', 10),
+)
+@functools.lru_cache(maxsize=None)
+def _node_style_string(color_style, font_size):
+    """Assembled node style string; only a few dozen distinct
+    (color, font) combinations exist, so repeats cost one dict probe
+    instead of three string concatenations"""
+    return f"rounded=1;whiteSpace=wrap;html=1;shadow=1;{color_style}fontSize={font_size};"
+
+_COLOR_STYLE_TIERS = (
+    ('main', "fillColor=#ff6b6b;strokeColor=#e03131;fontStyle=1;fontColor=white;"),
+    ('ctor', "fillColor=#51cf66;strokeColor=#37b24d;fontColor=white;"),
+    ('config', "fillColor=#69db7c;strokeColor=#51cf66;fontColor=white;"),
+    ('error', "fillColor=#ffd43b;strokeColor=#fab005;fontColor=#212529;"),
+    ('test', "fillColor=#da77f2;strokeColor=#be4bdb;fontColor=white;"),
+    ('io', "fillColor=#9775fa;strokeColor=#7950f2;fontColor=white;"),
+    ('timing', "fillColor=#ff8787;strokeColor=#fd7e14;fontColor=white;"),
+    ('accessor', "fillColor=#38d9a9;strokeColor=#20c997;fontColor=white;"),
+)
+
+# Isolated-node ordering tiers (lower rank = earlier in the layout)
+_ISOLATED_TIER_RE = _build_tier_scanner((
+    ('crit', ('main', '__main__', 'init', 'setup')),
+    ('config', ('config', 'configure', 'initialize')),
+    ('input', ('read', 'input', 'get')),
+    ('processing', ('process', 'calculate', 'compute')),
+    ('output', ('write', 'output', 'send')),
+    ('validation', ('validate', 'check', 'verify')),
+    ('timing', ('timer', 'delay', 'wait')),
+    ('modification', ('update', 'modify', 'set')),
+    ('storage', ('save', 'store', 'persist')),
+    ('cleanup', ('cleanup', 'close', 'finalize')),
+    ('test', ('test', 'check', 'assert')),
+    ('error', ('error', 'fail', 'exception')),
+    ('utility', ('helper', 'utility', 'util')),
+))
+_ISOLATED_TIER_RANK = {
+    'crit': 1, 'config': 2, 'input': 3, 'processing': 4, 'output': 5,
+    'validation': 6, 'timing': 7, 'modification': 8, 'storage': 9,
+    'cleanup': 10, 'test': 11, 'error': 12, 'utility': 13,
+}
+
+@functools.lru_cache(maxsize=None)
+def _isolated_priority(label_lower):
+    """Layout rank of one lowered isolated-node label (7 = default
+    middle tier)"""
+    rank = min((_ISOLATED_TIER_RANK[m.lastgroup]
+                for m in _ISOLATED_TIER_RE.finditer(label_lower)), default=7)
+    return rank
+
+# DOT parsing: one combined node/edge statement regex, dispatched on which
+# alternative matched, run as a single pass over the memory-mapped file
+_DOT_STATEMENT_RE = re.compile(
+    rb'(?P<nname>\w+)\s*\[(?:[^\]]*?\bid="(?P<nid>[^"]*)")?[^\]]*?\blabel="(?P<nlabel>[^"]+)"[^\]]*\]'
+    rb'|(?P<esrc>\w+)\s*->\s*(?P<etgt>\w+)(?:\s*\[[^\]]*\])?'
+)
+
+# Edge styling: one zero-width scan collects every category keyword present
+# in the target label; the call sites then walk their own fixed priority
+# order, preserving the original cascading-check semantics
+_EDGE_SOURCE_ENTRY_RE = re.compile(r'main|init|setup')
+_EDGE_TARGET_CAT_RE = _build_tier_scanner((
+    ('error', ('error', 'fail', 'exception', 'abort')),
+    ('cleanup', ('cleanup', 'close', 'finalize', 'destroy')),
+    ('timing', ('timer', 'delay', 'wait', 'sleep')),
+    ('io', ('read', 'write', 'input', 'output', 'send', 'receive')),
+    ('utility', ('get', 'set', 'property', 'util', 'helper')),
+))
+
+
+@functools.lru_cache(maxsize=4096)
+def _edge_source_is_entry(source_label):
+    """Whether edges from this label belong to the main execution path"""
+    return _EDGE_SOURCE_ENTRY_RE.search(source_label) is not None
+
+
+@functools.lru_cache(maxsize=4096)
+def _edge_target_categories(target_label):
+    """Frozenset of every category group present in the target label"""
+    return frozenset(m.lastgroup
+                     for m in _EDGE_TARGET_CAT_RE.finditer(target_label))
+
+def _build_edge_styles():
+    """Precompute every distinct edge style string, keyed by
+    (direction, category, long_distance)"""
+    base = ("edgeStyle=orthogonalEdgeStyle;rounded=1;orthogonalLoop=1;jettySize=auto;"
+            "html=1;endArrow=classic;shadow=1;labelBackgroundColor=#ffffff;")
+    routing = {
+        # Complex routing with enhanced waypoints vs simple direct routing
+        True: "entryX=0.5;entryY=0;exitX=0.5;exitY=1;noEdgeStyle=1;",
+        False: "entryX=0.5;entryY=0;exitX=0.5;exitY=1;",
+    }
+    elbow_vertical = "edgeStyle=elbowEdgeStyle;elbow=vertical;"
+    curve = {
+        True: "edgeStyle=elbowEdgeStyle;elbow=horizontal;",
+        False: "edgeStyle=orthogonalEdgeStyle;",
+    }
+
+    styles = {}
+    for long_distance in (False, True):
+        # Main execution flow (top to bottom)
+        styles[('down', 'main', long_distance)] = base + routing[long_distance] + \
+            "strokeWidth=4;strokeColor=#1976d2;fontColor=#1976d2;fontStyle=1;opacity=90;"
+        styles[('down', 'error', long_distance)] = base + routing[long_distance] + \
+            "strokeWidth=2.5;strokeColor=#e53e3e;dashed=1;opacity=85;"
+        styles[('down', 'io', long_distance)] = base + routing[long_distance] + \
+            "strokeWidth=2.5;strokeColor=#9775fa;opacity=85;"
+        styles[('down', 'cleanup', long_distance)] = base + routing[long_distance] + \
+            "strokeWidth=2;strokeColor=#fd7e14;dashed=1;opacity=80;"
+        styles[('down', None, long_distance)] = base + routing[long_distance] + \
+            "strokeWidth=2;strokeColor=#339af0;opacity=85;"
+
+        # Feedback, callbacks, or recursive calls (routing flag unused)
+        styles[('up', 'error', long_distance)] = base + elbow_vertical + \
+            "strokeWidth=2.5;strokeColor=#e53e3e;dashed=1;opacity=80;"
+        styles[('up', None, long_distance)] = base + elbow_vertical + \
+            "strokeWidth=2;strokeColor=#fd7e14;dashed=1;opacity=75;"
+
+        # Same-level calls (flag selects curved vs orthogonal routing)
+        styles[('lateral', 'error', long_distance)] = base + curve[long_distance] + \
+            "strokeWidth=2;strokeColor=#e53e3e;opacity=80;"
+        styles[('lateral', 'utility', long_distance)] = base + curve[long_distance] + \
+            "strokeWidth=1.5;strokeColor=#37b24d;opacity=75;"
+        styles[('lateral', 'timing', long_distance)] = base + curve[long_distance] + \
+            "strokeWidth=2;strokeColor=#ff8787;opacity=80;"
+        styles[('lateral', 'io', long_distance)] = base + curve[long_distance] + \
+            "strokeWidth=2;strokeColor=#9775fa;opacity=80;"
+        styles[('lateral', None, long_distance)] = base + curve[long_distance] + \
+            "strokeWidth=2;strokeColor=#38d9a9;opacity=80;"
+
+    return styles
+
+_EDGE_STYLES = _build_edge_styles()
+
+# Left-to-right ordering per keyword within a layout level (lower = left)
+_CATEGORY_ORDER = _build_keyword_map([
+    (1, ('main',)),
+    (2, ('constructor', 'setup', 'init')),
+    (3, ('config', 'configure', 'initialize')),
+    (4, ('start', 'begin', 'run', 'execute')),
+    (5, ('read', 'input', 'receive', 'get')),
+    (6, ('process', 'handle', 'calculate', 'compute')),
+    (7, ('validate', 'check', 'verify')),
+    (8, ('write', 'output', 'send', 'transmit')),
+    (9, ('update', 'modify', 'change')),
+    (10, ('save', 'store', 'persist')),
+    (11, ('timer', 'delay', 'wait', 'sleep')),
+    (12, ('cleanup', 'close', 'finalize')),
+    (13, ('error', 'fail', 'exception')),
+    (14, ('test', 'debug', 'trace')),
+    (15, ('helper', 'utility', 'util')),
+])
+
+# Single-pass character cleanup: '.' becomes '_' (module/package separator),
+# invalid filename/diagram characters are deleted outright
+_CHAR_CLEANUP_TABLE = str.maketrans({'.': '_'})
+_CHAR_CLEANUP_TABLE.update(str.maketrans('', '', '<>{}\\/:*?"|[]()'))
+
+@functools.lru_cache(maxsize=1)
+def _doxygen_version():
+    """Probe the Doxygen version once; repeat calls skip the fork/exec"""
+    import subprocess
+    try:
+        result = subprocess.run(['doxygen', '--version'],
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _resolve_dot(custom_path=None):
+    """Locate the DOT executable, probing the system at most once per
+    custom path. Returns (path, version_info) or None when not found."""
+    import shutil
+    import subprocess
+    dot_paths_to_check = [
+        'dot',  # System PATH
+        '/usr/bin/dot',  # Common Linux location
+        '/usr/local/bin/dot',  # Common macOS homebrew location
+        '/opt/homebrew/bin/dot',  # Apple Silicon homebrew location
+        'C:\\Program Files\\Graphviz\\bin\\dot.exe',  # Windows default
+        'C:\\Program Files (x86)\\Graphviz\\bin\\dot.exe',  # Windows x86
+    ]
+
+    # Check if user provided a custom DOT path
+    if custom_path:
+        dot_paths_to_check.insert(0, custom_path)
+
+    for dot_path in dot_paths_to_check:
+        # Resolve the candidate on the filesystem first so that missing
+        # locations never cost a fork/exec; only a found executable is
+        # probed for its version
+        resolved = shutil.which(dot_path) if os.path.basename(dot_path) == dot_path else (
+            dot_path if os.path.isfile(dot_path) else None)
+        if not resolved:
+            continue
+        try:
+            result = subprocess.run([dot_path, '-V'],
+                                    capture_output=True, text=True, check=True)
+            # DOT version info goes to stderr, not stdout
+            return dot_path, result.stderr.strip()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            continue
+
+    return None
+
+@functools.lru_cache(maxsize=1)
+def _drawio_launchers():
+    """Viewer commands for this platform in preference order, resolved at
+    most once per process. Each entry is (argv_prefix, use_shell,
+    is_desktop_app); the output path is appended at launch time."""
+    import shutil
+    system = sys.platform.lower()
+    launchers = []
+    if system == "darwin":  # macOS
+        if os.path.exists("/Applications/draw.io.app"):
+            launchers.append((("open", "-a", "draw.io"), False, True))
+        launchers.append((("open",), False, False))
+    elif system.startswith("linux"):  # Linux
+        if shutil.which("drawio"):
+            launchers.append((("drawio",), False, True))
+        if shutil.which("xdg-open"):
+            launchers.append((("xdg-open",), False, False))
+    elif system.startswith("win"):  # Windows
+        if shutil.which("draw.io.exe"):
+            launchers.append((("draw.io.exe",), False, True))
+        launchers.append((("start",), True, False))
+    return tuple(launchers)
+
+# Directories never descended into during the source-extension scan; they
+# are excluded from the Doxygen run anyway (see EXCLUDE_PATTERNS)
+_PRUNE_DIRS = frozenset({
+    '.git', '.svn', '.hg', 'build', 'dist', 'node_modules',
+    '__pycache__', '.venv', '.mypy_cache',
+})
+
+# Recognized source extensions bucketed by their last character, so the
+# extension scan can reject most filenames with a single dict probe
+_EXT_BY_LAST_CHAR = {
+    'c': ('.c', '.cc'),
+    'p': ('.cpp', '.hpp'),
+    'x': ('.cxx', '.hxx'),
+    'h': ('.h',),
+    'y': ('.py',),
+    'a': ('.java',),
+    's': ('.js', '.ts'),
+}
+
+# Project-type detection in priority order: first signature that intersects
+# the observed extension set wins (one C-level frozenset & per entry)
+_LANG_SIGNATURES = (
+    ("Python", frozenset({'.py'}), "*.py"),
+    ("C++", frozenset({'.cpp', '.cxx', '.cc', '.hpp', '.hxx'}), "*.cpp *.cxx *.cc *.hpp *.hxx *.h"),
+    ("C", frozenset({'.c', '.h'}), "*.c *.h"),
+    ("Java", frozenset({'.java'}), "*.java"),
+    ("JavaScript/TypeScript", frozenset({'.js', '.ts'}), "*.js *.ts"),
+)
+
+# Doxyfile template filled per project via str.format_map; kept at module
+# scope so the large literal is materialized once at import
+_DOXYFILE_TEMPLATE = '''# Doxyfile generated by Doxygen-to-Drawio Converter
+# Project: {project_name} ({project_type})
+
+#---------------------------------------------------------------------------
+# Project related configuration options
+#---------------------------------------------------------------------------
+DOXYFILE_ENCODING      = UTF-8
+PROJECT_NAME           = "{project_name}"
+PROJECT_NUMBER         = "1.0"
+PROJECT_BRIEF          = "Automatically generated documentation"
+OUTPUT_DIRECTORY       = {doxygen_output_base}
+CREATE_SUBDIRS         = NO
+ALLOW_UNICODE_NAMES    = NO
+OUTPUT_LANGUAGE        = English
+BRIEF_MEMBER_DESC      = YES
+REPEAT_BRIEF           = YES
+ABBREVIATE_BRIEF       = 
+ALWAYS_DETAILED_SEC    = NO
+INLINE_INHERITED_MEMB  = NO
+FULL_PATH_NAMES        = YES
+STRIP_FROM_PATH        = 
+STRIP_FROM_INC_PATH    = 
+SHORT_NAMES            = NO
+JAVADOC_AUTOBRIEF      = NO
+JAVADOC_BANNER         = NO
+QT_AUTOBRIEF           = NO
+MULTILINE_CPP_IS_BRIEF = NO
+PYTHON_DOCSTRING       = YES
+INHERIT_DOCS           = YES
+SEPARATE_MEMBER_PAGES  = NO
+TAB_SIZE               = 4
+ALIASES                = 
+OPTIMIZE_OUTPUT_FOR_C  = {optimize_c}
+OPTIMIZE_OUTPUT_JAVA   = {optimize_java}
+OPTIMIZE_FOR_FORTRAN   = NO
+OPTIMIZE_OUTPUT_VHDL   = NO
+OPTIMIZE_OUTPUT_SLICE  = NO
+EXTENSION_MAPPING      = 
+MARKDOWN_SUPPORT       = YES
+TOC_INCLUDE_HEADINGS   = 5
+AUTOLINK_SUPPORT       = YES
+BUILTIN_STL_SUPPORT    = YES
+CPP_CLI_SUPPORT        = NO
+SIP_SUPPORT            = NO
+IDL_PROPERTY_SUPPORT   = YES
+DISTRIBUTE_GROUP_DOC   = NO
+GROUP_NESTED_COMPOUNDS = NO
+SUBGROUPING            = YES
+INLINE_GROUPED_CLASSES = NO
+INLINE_SIMPLE_STRUCTS  = NO
+TYPEDEF_HIDES_STRUCT   = NO
+LOOKUP_CACHE_SIZE      = 0
+
+#---------------------------------------------------------------------------
+# Build related configuration options
+#---------------------------------------------------------------------------
+EXTRACT_ALL            = YES
+EXTRACT_PRIVATE        = YES
+EXTRACT_PRIV_VIRTUAL   = NO
+EXTRACT_PACKAGE        = NO
+EXTRACT_STATIC         = YES
+EXTRACT_LOCAL_CLASSES  = YES
+EXTRACT_LOCAL_METHODS  = NO
+EXTRACT_ANON_NSPACES   = NO
+HIDE_UNDOC_MEMBERS     = NO
+HIDE_UNDOC_CLASSES     = NO
+HIDE_FRIEND_COMPOUNDS  = NO
+HIDE_IN_BODY_DOCS      = NO
+INTERNAL_DOCS          = NO
+CASE_SENSE_NAMES       = {case_sense_names}
+HIDE_SCOPE_NAMES       = NO
+HIDE_COMPOUND_REFERENCE= NO
+SHOW_INCLUDE_FILES     = YES
+SHOW_GROUPED_MEMB_INC  = NO
+FORCE_LOCAL_INCLUDES   = NO
+INLINE_INFO            = YES
+SORT_MEMBER_DOCS       = YES
+SORT_BRIEF_DOCS        = NO
+SORT_MEMBERS_CTORS_1ST = NO
+SORT_GROUP_NAMES       = NO
+SORT_BY_SCOPE_NAME     = NO
+STRICT_PROTO_MATCHING  = NO
+GENERATE_TODOLIST      = YES
+GENERATE_TESTLIST      = YES
+GENERATE_BUGLIST       = YES
+GENERATE_DEPRECATEDLIST= YES
+ENABLED_SECTIONS       = 
+MAX_INITIALIZER_LINES  = 30
+SHOW_USED_FILES        = YES
+SHOW_FILES             = YES
+SHOW_NAMESPACES        = YES
+FILE_VERSION_FILTER    = 
+LAYOUT_FILE            = 
+CITE_BIB_FILES         = 
+
+#---------------------------------------------------------------------------
+# Configuration options related to warning and progress messages
+#---------------------------------------------------------------------------
+QUIET                  = NO
+WARNINGS               = YES
+WARN_IF_UNDOCUMENTED   = YES
+WARN_IF_DOC_ERROR      = YES
+WARN_NO_PARAMDOC       = NO
+WARN_AS_ERROR          = NO
+WARN_FORMAT            = "$file:$line: $text"
+WARN_LOGFILE           = 
+
+#---------------------------------------------------------------------------
+# Configuration options related to the input files
+#---------------------------------------------------------------------------
+INPUT                  = {source_dir}
+INPUT_ENCODING         = UTF-8
+FILE_PATTERNS          = {file_patterns}
+RECURSIVE              = YES
+EXCLUDE                = 
+EXCLUDE_SYMLINKS       = NO
+EXCLUDE_PATTERNS       = */build/* */dist/* */.git/* */node_modules/* */__pycache__/* *.tmp */.DS_Store
+EXCLUDE_SYMBOLS        = 
+EXAMPLE_PATH           = 
+EXAMPLE_PATTERNS       = 
+EXAMPLE_RECURSIVE      = NO
+IMAGE_PATH             = 
+INPUT_FILTER           = 
+FILTER_PATTERNS        = 
+FILTER_SOURCE_FILES    = NO
+FILTER_SOURCE_PATTERNS = 
+USE_MDFILE_AS_MAINPAGE = 
+
+#---------------------------------------------------------------------------
+# Configuration options related to source browsing
+#---------------------------------------------------------------------------
+SOURCE_BROWSER         = YES
+INLINE_SOURCES         = NO
+STRIP_CODE_COMMENTS    = YES
+REFERENCED_BY_RELATION = YES
+REFERENCES_RELATION    = YES
+REFERENCES_LINK_SOURCE = YES
+SOURCE_TOOLTIPS        = YES
+USE_HTAGS              = NO
+VERBATIM_HEADERS       = YES
+CLANG_ASSISTED_PARSING = NO
+CLANG_OPTIONS          = 
+CLANG_DATABASE_PATH    = 
+
+#---------------------------------------------------------------------------
+# Configuration options related to the alphabetical class index
+#---------------------------------------------------------------------------
+ALPHABETICAL_INDEX     = YES
+COLS_IN_ALPHA_INDEX    = 5
+IGNORE_PREFIX          = 
+
+#---------------------------------------------------------------------------
+# Configuration options related to the HTML output
+#---------------------------------------------------------------------------
+GENERATE_HTML          = YES
+HTML_OUTPUT            = html
+HTML_FILE_EXTENSION    = .html
+HTML_HEADER            = 
+HTML_FOOTER            = 
+HTML_STYLESHEET        = 
+HTML_EXTRA_STYLESHEET  = 
+HTML_EXTRA_FILES       = 
+HTML_COLORSTYLE_HUE    = 220
+HTML_COLORSTYLE_SAT    = 100
+HTML_COLORSTYLE_GAMMA  = 80
+HTML_TIMESTAMP         = NO
+HTML_DYNAMIC_MENUS     = YES
+HTML_DYNAMIC_SECTIONS  = NO
+HTML_INDEX_NUM_ENTRIES = 100
+GENERATE_DOCSET        = NO
+DOCSET_FEEDNAME        = "Doxygen generated docs"
+DOCSET_BUNDLE_ID       = org.doxygen.Project
+DOCSET_PUBLISHER_ID    = org.doxygen.Publisher
+DOCSET_PUBLISHER_NAME  = Publisher
+GENERATE_HTMLHELP      = NO
+CHM_FILE               = 
+HHC_LOCATION           = 
+GENERATE_CHI           = NO
+CHM_INDEX_ENCODING     = 
+BINARY_TOC             = NO
+TOC_EXPAND             = NO
+GENERATE_QHP           = NO
+QCH_FILE               = 
+QHP_NAMESPACE          = org.doxygen.Project
+QHP_VIRTUAL_FOLDER     = doc
+QHP_CUST_FILTER_NAME   = 
+QHP_CUST_FILTER_ATTRS  = 
+QHP_SECT_FILTER_ATTRS  = 
+QHG_LOCATION           = 
+GENERATE_ECLIPSEHELP   = NO
+ECLIPSE_DOC_ID         = org.doxygen.Project
+DISABLE_INDEX          = NO
+GENERATE_TREEVIEW      = NO
+ENUM_VALUES_PER_LINE   = 4
+TREEVIEW_WIDTH         = 250
+EXT_LINKS_IN_WINDOW    = NO
+FORMULA_FONTSIZE       = 10
+FORMULA_TRANSPARENT    = YES
+FORMULA_MACROFILE      = 
+USE_MATHJAX            = NO
+MATHJAX_FORMAT         = HTML-CSS
+MATHJAX_RELPATH        = https://cdn.jsdelivr.net/npm/mathjax@2
+MATHJAX_EXTENSIONS     = 
+MATHJAX_CODEFILE       = 
+SEARCHENGINE           = YES
+SERVER_BASED_SEARCH    = NO
+EXTERNAL_SEARCH        = NO
+SEARCHENGINE_URL       = 
+SEARCHDATA_FILE        = searchdata.xml
+EXTERNAL_SEARCH_ID     = 
+EXTRA_SEARCH_MAPPINGS  = 
+
+#---------------------------------------------------------------------------
+# Configuration options related to the LaTeX output
+#---------------------------------------------------------------------------
+GENERATE_LATEX         = NO
+
+#---------------------------------------------------------------------------
+# Configuration options related to the RTF output
+#---------------------------------------------------------------------------
+GENERATE_RTF           = NO
+
+#---------------------------------------------------------------------------
+# Configuration options related to the man page output
+#---------------------------------------------------------------------------
+GENERATE_MAN           = NO
+
+#---------------------------------------------------------------------------
+# Configuration options related to the XML output
+#---------------------------------------------------------------------------
+GENERATE_XML           = NO
+
+#---------------------------------------------------------------------------
+# Configuration options related to the DOCBOOK output
+#---------------------------------------------------------------------------
+GENERATE_DOCBOOK       = NO
+
+#---------------------------------------------------------------------------
+# Configuration options for the AutoGen Definitions output
+#---------------------------------------------------------------------------
+GENERATE_AUTOGEN_DEF   = NO
+
+#---------------------------------------------------------------------------
+# Configuration options related to the Perl module output
+#---------------------------------------------------------------------------
+GENERATE_PERLMOD       = NO
+
+#---------------------------------------------------------------------------
+# Configuration options related to the preprocessor
+#---------------------------------------------------------------------------
+ENABLE_PREPROCESSING   = YES
+MACRO_EXPANSION        = NO
+EXPAND_ONLY_PREDEF     = NO
+SEARCH_INCLUDES        = YES
+INCLUDE_PATH           = 
+INCLUDE_FILE_PATTERNS  = 
+PREDEFINED             = 
+EXPAND_AS_DEFINED      = 
+SKIP_FUNCTION_MACROS   = YES
+
+#---------------------------------------------------------------------------
+# Configuration options related to external references
+#---------------------------------------------------------------------------
+TAGFILES               = 
+GENERATE_TAGFILE       = 
+ALLEXTERNALS           = NO
+EXTERNAL_GROUPS        = YES
+EXTERNAL_PAGES         = YES
+
+#---------------------------------------------------------------------------
+# Configuration options related to the dot tool (CRITICAL FOR CALL GRAPHS)
+#---------------------------------------------------------------------------
+CLASS_DIAGRAMS         = YES
+DIA_PATH               = 
+HIDE_UNDOC_RELATIONS   = YES
+HAVE_DOT               = {have_dot}
+DOT_NUM_THREADS        = 0
+DOT_FONTNAME           = Helvetica
+DOT_FONTSIZE           = 10
+DOT_FONTPATH           = 
+{dot_path_line}
+CLASS_GRAPH            = YES
+COLLABORATION_GRAPH    = YES
+GROUP_GRAPHS           = YES
+UML_LOOK               = NO
+UML_LIMIT_NUM_FIELDS   = 10
+TEMPLATE_RELATIONS     = NO
+INCLUDE_GRAPH          = YES
+INCLUDED_BY_GRAPH      = YES
+CALL_GRAPH             = {call_graph}
+CALLER_GRAPH           = {caller_graph}
+GRAPHICAL_HIERARCHY    = YES
+DIRECTORY_GRAPH        = YES
+DOT_IMAGE_FORMAT       = png
+INTERACTIVE_SVG        = NO
+DOTFILE_DIRS           = 
+MSCFILE_DIRS           = 
+DIAFILE_DIRS           = 
+PLANTUML_JAR_PATH      = 
+PLANTUML_CFG_FILE      = 
+PLANTUML_INCLUDE_PATH  = 
+DOT_GRAPH_MAX_NODES    = 50
+MAX_DOT_GRAPH_DEPTH    = 0
+DOT_TRANSPARENT        = NO
+DOT_MULTI_TARGETS      = NO
+GENERATE_LEGEND        = YES
+DOT_CLEANUP            = NO
+'''
+
+# Parsing is dispatched to worker processes only when there are enough files
+# to amortize the pool startup cost
+_PARALLEL_PARSE_MIN_FILES = 8
+
+def parse_dot_file(dot_file_path):
+    """Parse one DOT file into raw node and edge tuples.
+
+    Pure function with no converter state so it can run in a worker
+    process. Returns (status, raw_nodes, raw_edges) where status is one of
+    'ok', 'invalid', 'error'; raw_nodes holds (original_id, unique_id,
+    label) tuples and raw_edges holds (source_id, target_id) tuples.
+    On 'error' the raw_nodes slot carries the error message.
+    """
+    try:
+        with open(dot_file_path, 'rb') as file:
+            content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (IOError, ValueError) as e:
+        return ('error', str(e), [])
+
+    raw_nodes = []
+    raw_edges = []
+
+    with content:
+        # Check if file contains valid digraph content; a plain substring
+        # find runs in C and skips the regex engine
+        if content.find(b'digraph') < 0:
+            return ('invalid', [], [])
+
+        for match in _DOT_STATEMENT_RE.finditer(content):
+            if match.lastgroup == 'etgt':
+                raw_edges.append((match.group('esrc').decode('ascii', 'replace'),
+                                  match.group('etgt').decode('ascii', 'replace')))
+                continue
+
+            # Node statement: label and optional unique id are captured by
+            # the statement regex itself, so the attribute block is not
+            # re-scanned
+            original_node_id = match.group('nname').decode('ascii', 'replace')
+            node_label = match.group('nlabel').decode('utf-8', 'replace')
+            unique_id = match.group('nid')
+            node_unique_id = unique_id.decode('utf-8', 'replace') if unique_id is not None else original_node_id
+            raw_nodes.append((original_node_id, node_unique_id, node_label))
+
+    return ('ok', raw_nodes, raw_edges)
+
+@functools.lru_cache(maxsize=8192)
+def _clean_label(label):
+    """Clean one raw (non-empty) DOT label into a display name.
+
+    Pure string work, so it is memoized: overloads and template
+    instantiations make the same raw label recur across DOT files, and
+    repeats become a single dict lookup.
+    """
+    # Remove escape sequences and clean whitespace
+    label = label.replace('\\l', ' ').replace('\n', ' ').strip()
+
+    # Remove common Doxygen path prefixes for different project types
+    # Generic project patterns
+    label = _PATH_PREFIX_RE1.sub('', label)
+    label = _PATH_PREFIX_RE2.sub('', label)
+    label = _PATH_PREFIX_RE3.sub('', label)
+
+    # Remove file extensions for multiple languages
+    label = _FILE_EXT_RE.sub('', label)
+
+    # Clean namespace/module separators and special characters in one
+    # translate pass ('::' and '->' are two-char tokens, handled first)
+    label = label.replace('::', '_').replace('->', '_')
+    label = label.translate(_CHAR_CLEANUP_TABLE)
+    label = _MULTI_UNDERSCORE_RE.sub('_', label)  # Multiple underscores
+    label = label.strip('_')
+
+    if not label:
+        return ''
+
+    # Truncate very long labels but keep them meaningful; intern the
+    # result - the same function names recur across many DOT files, so
+    # interning collapses duplicates and makes later dict lookups on the
+    # label pointer-compare fast
+    return sys.intern(label if len(label) <= 25 else f"{label[:22]}...")
+
+@functools.lru_cache(maxsize=16)
+def _doxyfile_skeleton(project_type, have_dot):
+    """Pre-render the Doxyfile template for one (project type, DOT) combo.
+
+    The language-optimization and call-graph flag lines depend only on
+    these two small axes, so the partially-filled body is cached; only
+    the per-project placeholders are left for the caller to format.
+    """
+    yes_no = 'YES' if have_dot else 'NO'
+    return _DOXYFILE_TEMPLATE.format_map({
+        'project_name': '{project_name}',
+        'project_type': project_type,
+        'doxygen_output_base': '{doxygen_output_base}',
+        'optimize_c': 'YES' if project_type == 'C' else 'NO',
+        'optimize_java': 'YES' if project_type == 'Java' else 'NO',
+        'case_sense_names': 'YES' if project_type != 'Windows' else 'NO',
+        'source_dir': '{source_dir}',
+        'file_patterns': '{file_patterns}',
+        'have_dot': yes_no,
+        'dot_path_line': '{dot_path_line}',
+        'call_graph': yes_no,
+        'caller_graph': yes_no,
+    })
+
+# Single-pass XML escape for node labels; three chained .replace calls
+# would scan every label three times
+_XML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+# Attribute-value escape for the direct text emitter - the same set of
+# substitutions ElementTree applies when serializing attributes
+_ATTR_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;',
+                              '"': '&quot;', '\r': '&#13;', '\n': '&#10;',
+                              '\t': '&#09;'})
+
+# Fixed attributes of the document envelope, shared by both serializers
+_MXFILE_ATTRS = {
+    'host': "app.diagrams.net",
+    'modified': "2025-07-18T00:00:00.000Z",
+    'agent': "Doxygen-to-Drawio Converter v2.0",
+    'etag': "doxygen-generated-flowchart",
+    'version': "24.2.5",
+}
+_DIAGRAM_ATTRS = {
+    'name': "Doxygen Function Flow Chart",
+    'id': "doxygen-flow-chart",
+}
+
+
+def _fmt_attrs(attrs):
+    """Render an attribute dict as ' key="value"...' with escaped values.
+    Numeric values (geometry coordinates and sizes) are formatted straight
+    into the f-string - no intermediate str() object and no escape scan"""
+    return ''.join(f' {name}="{value.translate(_ATTR_ESCAPE)}"'
+                   if value.__class__ is str else f' {name}="{value}"'
+                   for name, value in attrs.items())
+
+
+def _str_attrs(attrs):
+    """ElementTree wants string attribute values; the cell stream keeps
+    numbers as ints for the text emitter"""
+    return {name: value if value.__class__ is str else str(value)
+            for name, value in attrs.items()}
+
+# Base character width estimation per font size (pixels per character)
+_CHAR_WIDTH_MAP = {
+    9: 5.5,   # Small font
+    10: 6.0,
+    11: 6.5,  # Default font
+    12: 7.0,  # Main function font
+    13: 7.5,
+    14: 8.0,
+    16: 9.0,
+}
+
+@functools.lru_cache(maxsize=None)
+def _node_size(label_len, font_size, is_isolated):
+    """Node (width, height) for one label length / font / isolation combo.
+
+    Pure arithmetic on a small input space (labels are truncated to 25
+    characters), so repeats across the whole graph are cache hits.
+    """
+    char_width = _CHAR_WIDTH_MAP.get(font_size, 6.5)
+    text_width = label_len * char_width
+
+    # Minimum and maximum sizes
+    min_width = 100
+    max_width = 300
+    min_height = 50
+    max_height = 100
+
+    # Calculate width with padding
+    padding_horizontal = 20
+    calculated_width = max(min_width, min(max_width, text_width + padding_horizontal))
+
+    # Calculate height based on font size and potential line wrapping
+    padding_vertical = 20
+    line_height = font_size + 4  # Font size plus line spacing
+
+    # Check if text needs wrapping
+    if text_width > (max_width - padding_horizontal):
+        # Multi-line text
+        lines_needed = max(1, int(text_width / (max_width - padding_horizontal)) + 1)
+        calculated_height = max(min_height, min(max_height, lines_needed * line_height + padding_vertical))
+    else:
+        # Single line text
+        calculated_height = max(min_height, line_height + padding_vertical)
+
+    # Adjust for isolated nodes (slightly smaller)
+    if is_isolated:
+        calculated_width = max(min_width - 10, calculated_width - 10)
+        calculated_height = max(min_height - 5, calculated_height - 5)
+
+    return int(calculated_width), int(calculated_height)
 
 # Colors for terminal output
 class Colors:
@@ -34,960 +922,617 @@ class Colors:
     WHITE = '\033[1;37m'
     NC = '\033[0m'  # No Color
     
-    @staticmethod
-    def colored(text, color):
-        return f"{color}{text}{Colors.NC}"
-
-class DoxygenToDrawioConverter:
-    def __init__(self, doxygen_output_dir="doxygen_output/html", output_file="doxygen_callgraph.drawio", auto_open=False, no_prompt=False, source_dir=None, run_doxygen=False, dot_path=None):
-        self.doxygen_output_dir = doxygen_output_dir
-        self.output_file = output_file
-        self.auto_open = auto_open
-        self.no_prompt = no_prompt
-        self.source_dir = source_dir or "."  # Default to current directory
-        self.run_doxygen = run_doxygen
-        self.dot_path = dot_path  # Custom DOT executable path
-        self.label_to_simple = {}     # Maps labels to simple IDs (for deduplication)
-        self.simple_to_label = {}     # Maps simple IDs to labels
-        self.all_edges = []
-        self.node_counter = 1
-        self.original_to_simple = {}  # Maps original node IDs to simple IDs
-        self.file_sources = {}        # Track which files nodes came from
-        
-    def find_dot_files(self):
-        """Find all DOT files in the Doxygen output directory"""
-        dot_pattern = os.path.join(self.doxygen_output_dir, "*.dot")
-        dot_files = glob.glob(dot_pattern)
-        
-        if not dot_files:
-            print(Colors.colored(f"Error: No .dot files found in '{self.doxygen_output_dir}'.", Colors.RED))
-            print("Make sure Doxygen has been run with HAVE_DOT=YES and CALL_GRAPH=YES")
-            return []
-            
-        print(Colors.colored(f"Found {len(dot_files)} DOT files:", Colors.GREEN))
-        for dot_file in dot_files:
-            print(f"  - {os.path.basename(dot_file)}")
-        
-        return dot_files
-    
-    def clean_node_label(self, label, file_source=""):
-        """Clean and normalize node labels for multiple programming languages"""
-        if not label:
-            return f"Node{self.node_counter}"
-            
-        # Remove escape sequences and clean whitespace
-        label = label.replace('\\l', ' ').replace('\n', ' ').strip()
-        
-        # Remove common Doxygen path prefixes for different project types
-        # Generic project patterns
-        label = re.sub(r'[^/]+/(?:Core/(?:Inc|Src)/|src/|include/|lib/|bin/|Source/|Headers/)', '', label)
-        label = re.sub(r'(?:\.\./)*/(?:src/|include/|lib/|bin/|Source/|Headers/)', '', label)
-        label = re.sub(r'.*/(?:src/|include/|lib/|bin/|Source/|Headers/)/', '', label)
-        
-        # Remove file extensions for multiple languages
-        label = re.sub(r'\.(c|h|cpp|hpp|cc|cxx|c\+\+|py|pyx|pyi|java|js|ts|jsx|tsx|go|rs|swift|m|mm|cs|php|rb|pl|sh|asm|s)$', '', label)
-        
-        # Clean namespace/module separators and special characters
-        label = re.sub(r'::', '_', label)  # C++ namespace separator
-        label = re.sub(r'\.', '_', label)   # Python module separator, Java package separator
-        label = re.sub(r'->', '_', label)   # C pointer operator
-        label = re.sub(r'[<>{}\\/:*?"|\[\]()]', '', label)  # Invalid chars and parentheses
-        label = re.sub(r'[_]{2,}', '_', label)  # Multiple underscores
-        label = label.strip('_')
-        
-        # Handle special function types
-        if label.startswith('__') and label.endswith('__'):
-            # Keep Python dunder methods readable but clean
-            pass
-        elif label.startswith('_'):
-            # Handle private methods/functions
-            pass
-        
-        # Handle empty labels after cleaning
-        if not label:
-            label = f"Node{self.node_counter}"
-        
-        # Truncate very long labels but keep them meaningful
-        if len(label) > 25:
-            label = label[:22] + "..."
-        
-        return label
-    
-    def find_similar_node(self, clean_label, node_unique_id, file_source):
-        """Find if a similar node already exists to avoid duplicates"""
-        # First check exact label match
-        if clean_label in self.label_to_simple:
-            return self.label_to_simple[clean_label]
-        
-        # Check for very similar labels (fuzzy matching)
-        for existing_label, existing_id in self.label_to_simple.items():
-            # Check if labels are very similar (accounting for minor variations)
-            if self.are_labels_similar(clean_label, existing_label):
-                return existing_id
-        
-        return None
-    
-    def are_labels_similar(self, label1, label2):
-        """Check if two labels represent the same function/node"""
-        if label1 == label2:
-            return True
-        
-        # Normalize both labels for comparison
-        norm1 = label1.lower().strip('_').replace('_', '').replace('-', '')
-        norm2 = label2.lower().strip('_').replace('_', '').replace('-', '')
-        
-        # Check if one is a substring of the other (for different name variations)
-        if norm1 in norm2 or norm2 in norm1:
-            # Only consider similar if the difference is not too large
-            min_len = min(len(norm1), len(norm2))
-            max_len = max(len(norm1), len(norm2))
-            if max_len <= min_len * 1.5:  # Allow 50% difference
-                return True
-        
-        # Check for common function name patterns
-        # Remove common prefixes/suffixes that might differ
-        patterns_to_remove = ['get_', 'set_', 'is_', 'has_', 'do_', 'handle_', 'process_', 'init_', 'setup_', 'create_', 'delete_', 'update_']
-        
-        clean1 = norm1
-        clean2 = norm2
-        
-        for pattern in patterns_to_remove:
-            clean1 = clean1.replace(pattern, '')
-            clean2 = clean2.replace(pattern, '')
-        
-        return clean1 == clean2
-    
-    def get_execution_priority(self, label, outgoing_count, incoming_count):
-        """Calculate execution priority for sequence-based ordering"""
-        label_lower = label.lower()
-        priority = 0
-        
-        # Function type priorities (higher = earlier in execution)
-        if any(pattern in label_lower for pattern in ['main', '__main__', 'main()', 'int main']):
-            priority += 100
-        elif any(pattern in label_lower for pattern in ['__init__', 'constructor']):
-            priority += 90
-        elif any(pattern in label_lower for pattern in ['setup', 'initialize', 'init', 'config']):
-            priority += 80
-        elif any(pattern in label_lower for pattern in ['start', 'begin', 'run', 'execute']):
-            priority += 70
-        elif any(pattern in label_lower for pattern in ['process', 'handle', 'update', 'loop']):
-            priority += 60
-        elif any(pattern in label_lower for pattern in ['read', 'input', 'receive', 'get']):
-            priority += 50
-        elif any(pattern in label_lower for pattern in ['write', 'output', 'send', 'transmit']):
-            priority += 45
-        elif any(pattern in label_lower for pattern in ['calculate', 'compute', 'transform']):
-            priority += 40
-        elif any(pattern in label_lower for pattern in ['validate', 'check', 'verify']):
-            priority += 35
-        elif any(pattern in label_lower for pattern in ['save', 'store', 'persist']):
-            priority += 30
-        elif any(pattern in label_lower for pattern in ['cleanup', 'close', 'finalize', 'destroy']):
-            priority += 20
-        elif any(pattern in label_lower for pattern in ['error', 'fail', 'exception', 'abort']):
-            priority += 15
-        elif any(pattern in label_lower for pattern in ['test', 'debug', 'trace']):
-            priority += 10
-        elif any(pattern in label_lower for pattern in ['helper', 'utility', 'util']):
-            priority += 5
-        
-        # Connectivity-based adjustments
-        priority += min(20, outgoing_count * 2)  # Functions that call many others are orchestrators
-        priority += min(10, incoming_count)      # Popular functions are important
-        
-        return priority
-    
-    def refine_levels_by_function_type(self, levels, connected_nodes, incoming, outgoing):
-        """Refine level assignments based on functional relationships"""
-        # Group functions by type for better organization
-        function_groups = {
-            'entry': [],      # main, init functions
-            'core': [],       # primary business logic
-            'io': [],         # input/output operations
-            'processing': [], # data processing and computation
-            'utility': [],    # helper and utility functions
-            'error': [],      # error handling
-            'cleanup': []     # cleanup and finalization
-        }
-        
-        # Categorize functions
-        for node in connected_nodes:
-            label_lower = connected_nodes[node].lower()
-            
-            if any(pattern in label_lower for pattern in ['main', '__main__', '__init__', 'constructor', 'setup', 'initialize']):
-                function_groups['entry'].append(node)
-            elif any(pattern in label_lower for pattern in ['error', 'fail', 'exception', 'abort', 'catch']):
-                function_groups['error'].append(node)
-            elif any(pattern in label_lower for pattern in ['cleanup', 'close', 'finalize', 'destroy', 'delete']):
-                function_groups['cleanup'].append(node)
-            elif any(pattern in label_lower for pattern in ['read', 'write', 'input', 'output', 'send', 'receive']):
-                function_groups['io'].append(node)
-            elif any(pattern in label_lower for pattern in ['process', 'calculate', 'compute', 'transform', 'parse']):
-                function_groups['processing'].append(node)
-            elif any(pattern in label_lower for pattern in ['helper', 'utility', 'util', 'get', 'set']):
-                function_groups['utility'].append(node)
-            else:
-                function_groups['core'].append(node)
-        
-        # Adjust levels to create logical flow
-        # Entry functions should be at the top
-        min_entry_level = min([levels.get(node, 0) for node in function_groups['entry']], default=0)
-        
-        # Error handling functions should be grouped together but not necessarily at the end
-        if function_groups['error']:
-            error_target_level = max(2, min_entry_level + 2)
-            for node in function_groups['error']:
-                # Move error handlers closer together but respect dependencies
-                if levels.get(node, 0) > error_target_level + 1:
-                    # Only move if it doesn't violate dependencies
-                    can_move = all(levels.get(parent, 0) < error_target_level for parent in incoming[node])
-                    if can_move:
-                        levels[node] = error_target_level
-        
-        # Cleanup functions should generally be later in the flow
-        if function_groups['cleanup']:
-            cleanup_base_level = max([levels.get(node, 0) for node in connected_nodes]) - 1
-            for node in function_groups['cleanup']:
-                if levels.get(node, 0) < cleanup_base_level:
-                    # Only move if it doesn't violate dependencies
-                    can_move = all(levels.get(parent, 0) < cleanup_base_level for parent in incoming[node])
-                    if can_move:
-                        levels[node] = cleanup_base_level
-    
-    def get_function_category_order(self, label):
-        """Get ordering value for function categories (lower = left, higher = right)"""
-        label_lower = label.lower()
-        
-        # Left to right ordering within a level (execution sequence)
-        if any(pattern in label_lower for pattern in ['main', '__main__', 'main()']):
-            return 1  # Main functions on the far left
-        elif any(pattern in label_lower for pattern in ['__init__', 'constructor', 'setup']):
-            return 2  # Initialization functions
-        elif any(pattern in label_lower for pattern in ['config', 'configure', 'initialize']):
-            return 3  # Configuration functions
-        elif any(pattern in label_lower for pattern in ['start', 'begin', 'run', 'execute']):
-            return 4  # Execution functions
-        elif any(pattern in label_lower for pattern in ['read', 'input', 'receive', 'get']):
-            return 5  # Input operations
-        elif any(pattern in label_lower for pattern in ['process', 'handle', 'calculate', 'compute']):
-            return 6  # Processing functions
-        elif any(pattern in label_lower for pattern in ['validate', 'check', 'verify']):
-            return 7  # Validation functions
-        elif any(pattern in label_lower for pattern in ['write', 'output', 'send', 'transmit']):
-            return 8  # Output operations
-        elif any(pattern in label_lower for pattern in ['update', 'modify', 'change']):
-            return 9  # Update operations
-        elif any(pattern in label_lower for pattern in ['save', 'store', 'persist']):
-            return 10 # Storage operations
-        elif any(pattern in label_lower for pattern in ['timer', 'delay', 'wait', 'sleep']):
-            return 11 # Timing operations
-        elif any(pattern in label_lower for pattern in ['cleanup', 'close', 'finalize']):
-            return 12 # Cleanup operations
-        elif any(pattern in label_lower for pattern in ['error', 'fail', 'exception']):
-            return 13 # Error handling on the right
-        elif any(pattern in label_lower for pattern in ['test', 'debug', 'trace']):
-            return 14 # Testing functions
-        elif any(pattern in label_lower for pattern in ['helper', 'utility', 'util']):
-            return 15 # Utility functions on the far right
-        else:
-            return 6  # Default to middle (processing category)
-    
-    def get_edge_style(self, source_label, target_label, source_x, source_y, target_x, target_y):
-        """Determine edge style based on execution sequence and function relationships with enhanced routing"""
-        
-        # Determine flow direction
-        is_downward = target_y > source_y
-        is_upward = target_y < source_y
-        is_lateral = target_y == source_y
-        
-        # Calculate distances for style decisions
-        x_distance = abs(target_x - source_x)
-        y_distance = abs(target_y - source_y)
-        
-        # Determine function relationship types
-        is_main_entry = any(keyword in source_label for keyword in ['main', '__main__', 'init', 'setup'])
-        is_error_handling = any(keyword in target_label for keyword in ['error', 'fail', 'exception', 'abort'])
-        is_utility_call = any(keyword in target_label for keyword in ['get', 'set', 'property', 'util', 'helper'])
-        is_io_operation = any(keyword in target_label for keyword in ['read', 'write', 'input', 'output', 'send', 'receive'])
-        is_cleanup = any(keyword in target_label for keyword in ['cleanup', 'close', 'finalize', 'destroy'])
-        is_timing = any(keyword in target_label for keyword in ['timer', 'delay', 'wait', 'sleep'])
-        
-        # Enhanced base style with better routing
-        base_style = "edgeStyle=orthogonalEdgeStyle;rounded=1;orthogonalLoop=1;jettySize=auto;html=1;endArrow=classic;shadow=1;labelBackgroundColor=#ffffff;"
-        
-        # Add connection-specific style based on complexity
-        if x_distance > 300 or (is_lateral and x_distance > 200) or (is_upward and x_distance > 150):
-            # Complex routing with enhanced waypoints
-            routing_style = "entryX=0.5;entryY=0;exitX=0.5;exitY=1;noEdgeStyle=1;"
-        else:
-            # Simple direct routing
-            routing_style = "entryX=0.5;entryY=0;exitX=0.5;exitY=1;"
-        
-        if is_downward:
-            # Main execution flow (top to bottom)
-            if is_main_entry:
-                # Critical path from main/init functions - thicker, more prominent
-                return base_style + routing_style + "strokeWidth=4;strokeColor=#1976d2;fontColor=#1976d2;fontStyle=1;opacity=90;"
-            elif is_error_handling:
-                # Error handling branches - red dashed
-                return base_style + routing_style + "strokeWidth=2.5;strokeColor=#e53e3e;dashed=1;opacity=85;"
-            elif is_io_operation:
-                # I/O operations flow - purple
-                return base_style + routing_style + "strokeWidth=2.5;strokeColor=#9775fa;opacity=85;"
-            elif is_cleanup:
-                # Cleanup operations - orange dashed
-                return base_style + routing_style + "strokeWidth=2;strokeColor=#fd7e14;dashed=1;opacity=80;"
-            else:
-                # Regular execution flow - blue
-                return base_style + routing_style + "strokeWidth=2;strokeColor=#339af0;opacity=85;"
-                
-        elif is_upward:
-            # Feedback, callbacks, or recursive calls - need special visual treatment
-            if is_error_handling:
-                # Error reporting upward - red curved with high visibility
-                return base_style + "edgeStyle=elbowEdgeStyle;elbow=vertical;" + "strokeWidth=2.5;strokeColor=#e53e3e;dashed=1;opacity=80;"
-            else:
-                # Callbacks, recursion - orange curved
-                return base_style + "edgeStyle=elbowEdgeStyle;elbow=vertical;" + "strokeWidth=2;strokeColor=#fd7e14;dashed=1;opacity=75;"
-                
-        else:  # is_lateral
-            # Same-level function calls - use curved routing to avoid overlaps
-            curve_style = "edgeStyle=elbowEdgeStyle;elbow=horizontal;" if x_distance > 200 else "edgeStyle=orthogonalEdgeStyle;"
-            
-            if is_error_handling:
-                # Error handling at same level - red
-                return base_style + curve_style + "strokeWidth=2;strokeColor=#e53e3e;opacity=80;"
-            elif is_utility_call:
-                # Utility and helper function calls - green, thinner
-                return base_style + curve_style + "strokeWidth=1.5;strokeColor=#37b24d;opacity=75;"
-            elif is_timing:
-                # Timing and delay calls - salmon
-                return base_style + curve_style + "strokeWidth=2;strokeColor=#ff8787;opacity=80;"
-            elif is_io_operation:
-                # I/O operations at same level - purple
-                return base_style + curve_style + "strokeWidth=2;strokeColor=#9775fa;opacity=80;"
-            else:
-                # Regular peer function calls - teal
-                return base_style + curve_style + "strokeWidth=2;strokeColor=#38d9a9;opacity=80;"
-    
-    def add_execution_waypoints(self, geometry, source_x, source_y, target_x, target_y, 
-                               source_label, target_label, max_node_width):
-        """Add intelligent waypoints for better execution flow visualization with node collision avoidance"""
-        
-        # Calculate distances and decide if waypoints are needed
-        x_distance = abs(target_x - source_x)
-        y_distance = abs(target_y - source_y)
-        
-        # Estimate node dimensions for collision avoidance
-        node_width = max_node_width
-        node_height = 80  # Estimated average node height
-        
-        # Add buffer space around nodes
-        buffer_x = 30
-        buffer_y = 20
-        
-        waypoints = []
-        
-        # Determine connection type and optimal routing
-        if target_y == source_y:
-            # Same level (horizontal) connections
-            self._add_horizontal_waypoints(waypoints, source_x, source_y, target_x, target_y, 
-                                         source_label, target_label, node_width, node_height, 
-                                         buffer_x, buffer_y)
-        elif target_y > source_y:
-            # Downward flow (normal execution)
-            self._add_downward_waypoints(waypoints, source_x, source_y, target_x, target_y,
-                                       source_label, target_label, node_width, node_height,
-                                       buffer_x, buffer_y, x_distance, y_distance)
-        else:
-            # Upward flow (callbacks, recursion)
-            self._add_upward_waypoints(waypoints, source_x, source_y, target_x, target_y,
-                                     source_label, target_label, node_width, node_height,
-                                     buffer_x, buffer_y, x_distance, y_distance)
-        
-        # Add waypoints to geometry if any were created
-        if waypoints:
-            array = ET.SubElement(geometry, 'Array')
-            array.set('as', 'points')
-            
-            for waypoint_x, waypoint_y in waypoints:
-                point = ET.SubElement(array, 'mxPoint', x=str(int(waypoint_x)), y=str(int(waypoint_y)))
-    
-    def _add_horizontal_waypoints(self, waypoints, source_x, source_y, target_x, target_y,
-                                source_label, target_label, node_width, node_height, buffer_x, buffer_y):
-        """Add waypoints for horizontal (same-level) connections"""
-        x_distance = abs(target_x - source_x)
-        
-        # Only add waypoints for longer horizontal connections
-        if x_distance > node_width * 1.5:
-            # Determine routing preference based on function type
-            route_above = True  # Default to routing above
-            offset_y = -50  # Default offset above nodes
-            
-            if any(keyword in target_label for keyword in ['error', 'fail', 'exception']):
-                route_above = True
-                offset_y = -60  # Route error calls higher above
-            elif any(keyword in target_label for keyword in ['cleanup', 'finalize', 'destroy']):
-                route_above = False
-                offset_y = 60  # Route cleanup calls below
-            elif any(keyword in target_label for keyword in ['util', 'helper', 'get', 'set']):
-                route_above = True
-                offset_y = -40  # Route utility calls slightly above
-            
-            # Calculate waypoint positions
-            if x_distance > node_width * 3:
-                # Long horizontal connection - use multiple waypoints for smoother curve
-                quarter_x = source_x + (target_x - source_x) * 0.25
-                mid_x = source_x + (target_x - source_x) * 0.5
-                three_quarter_x = source_x + (target_x - source_x) * 0.75
-                
-                waypoint_y = source_y + offset_y
-                
-                waypoints.extend([
-                    (quarter_x, waypoint_y),
-                    (mid_x, waypoint_y),
-                    (three_quarter_x, waypoint_y)
-                ])
-            else:
-                # Medium horizontal connection - use single waypoint
-                mid_x = source_x + (target_x - source_x) * 0.5
-                waypoint_y = source_y + offset_y
-                waypoints.append((mid_x, waypoint_y))
-    
-    def _add_downward_waypoints(self, waypoints, source_x, source_y, target_x, target_y,
-                              source_label, target_label, node_width, node_height, 
-                              buffer_x, buffer_y, x_distance, y_distance):
-        """Add waypoints for downward (normal execution) flow"""
+    @staticmethod
+    def colored(text, color):
+        return f"{color}{text}{Colors.NC}"
+
+class NodeInfo:
+    """Per-node record keeping label, functional category and originating
+    file together instead of spread across parallel dicts"""
+    __slots__ = ('label', 'label_lower', 'category', 'file_source')
+
+    def __init__(self, label, category, file_source):
+        self.label = label
+        # Lowered once here; sort tiebreakers and keyword checks hit this
+        # repeatedly per node
+        self.label_lower = sys.intern(label.lower())
+        self.category = category
+        self.file_source = file_source
+
+class DoxygenToDrawioConverter:
+    # Fixed attribute layout: no per-instance __dict__, and attribute access
+    # in the hot loops resolves to fixed slot offsets
+    __slots__ = ('doxygen_output_dir', 'output_file', 'auto_open', 'no_prompt',
+                 'source_dir', 'run_doxygen', 'dot_path', 'safe_xml', '_cwd',
+                 '_doxyfile_path', '_doxyfile_dir', '_doxyfile_name',
+                 'label_to_simple', '_normalized_cache', '_shingle_index',
+                 'nodes', 'all_edges', 'adj_out', 'adj_in', 'node_counter',
+                 'original_to_simple')
+
+    def __init__(self, doxygen_output_dir="doxygen_output/html", output_file="doxygen_callgraph.drawio", auto_open=False, no_prompt=False, source_dir=None, run_doxygen=False, dot_path=None, safe_xml=False):
+        self.doxygen_output_dir = doxygen_output_dir
+        self.output_file = output_file
+        self.auto_open = auto_open
+        self.no_prompt = no_prompt
+        self.source_dir = source_dir or "."  # Default to current directory
+        self.run_doxygen = run_doxygen
+        self.dot_path = dot_path  # Custom DOT executable path
+        self.safe_xml = safe_xml  # Serialize via ElementTree instead of text
+        self._cwd = os.getcwd()   # Cached once; getcwd is a syscall per call
+        self._doxyfile_path = None  # Doxyfile path with its dir/name split,
+        self._doxyfile_dir = None   # cached by _remember_doxyfile once the
+        self._doxyfile_name = None  # path is known
+        self.label_to_simple = {}     # Maps labels to simple IDs (for deduplication)
+        self._normalized_cache = {}   # Maps labels to their normalized form (computed once)
+        self._shingle_index = {}      # Maps 3-gram shingles to labels containing them
+        self.nodes = {}               # Maps simple IDs to NodeInfo records
+        self.all_edges = []           # Edges in insertion order (XML output)
+        self.adj_out = {}             # node -> {target: None}; inner dicts act
+        self.adj_in = {}              # node -> {source: None}; as ordered sets
+        self.node_counter = 1
+        self.original_to_simple = {}  # Maps original node IDs to simple IDs
         
-        # For large horizontal offsets in downward flow, create stepped routing
-        if x_distance > node_width * 2:
-            # Step down and across to avoid crossing other nodes
-            
-            # First waypoint: step down from source
-            waypoint1_x = source_x
-            waypoint1_y = source_y + node_height + buffer_y
-            
-            # Second waypoint: move horizontally at intermediate level
-            waypoint2_x = target_x
-            waypoint2_y = waypoint1_y
+    def find_dot_files(self):
+        """Find all DOT files in the Doxygen output directory"""
+        # os.scandir returns file-type info with the directory entries, so no
+        # per-file stat is needed; sorted for deterministic processing order
+        try:
+            with os.scandir(self.doxygen_output_dir) as entries:
+                dot_files = sorted(entry.path for entry in entries
+                                   if entry.name.endswith('.dot') and entry.is_file())
+        except OSError:
+            dot_files = []
+
+        if not dot_files:
+            print(Colors.colored(f"Error: No .dot files found in '{self.doxygen_output_dir}'.", Colors.RED))
+            print("Make sure Doxygen has been run with HAVE_DOT=YES and CALL_GRAPH=YES")
+            return []
             
-            # Third waypoint: step down to target level if there's still distance
-            if y_distance > (node_height + buffer_y * 2):
-                waypoint3_x = target_x
-                waypoint3_y = target_y - node_height // 2 - buffer_y
-                waypoints.extend([
-                    (waypoint1_x, waypoint1_y),
-                    (waypoint2_x, waypoint2_y),
-                    (waypoint3_x, waypoint3_y)
-                ])
-            else:
-                waypoints.extend([
-                    (waypoint1_x, waypoint1_y),
-                    (waypoint2_x, waypoint2_y)
-                ])
-        elif x_distance > node_width * 0.8:
-            # Medium horizontal offset - single intermediate waypoint
-            mid_x = source_x + (target_x - source_x) * 0.7
-            mid_y = source_y + y_distance * 0.6
-            waypoints.append((mid_x, mid_y))
-    
-    def _add_upward_waypoints(self, waypoints, source_x, source_y, target_x, target_y,
-                            source_label, target_label, node_width, node_height,
-                            buffer_x, buffer_y, x_distance, y_distance):
-        """Add waypoints for upward (callback/recursion) flow"""
+        print(Colors.colored(f"Found {len(dot_files)} DOT files:", Colors.GREEN))
+        for dot_file in dot_files:
+            print(f"  - {os.path.basename(dot_file)}")
         
-        # Upward flow needs special handling to avoid crossing nodes
-        if x_distance > node_width:
-            # Route around the side to avoid crossing intermediate nodes
-            
-            # Determine which side to route around based on horizontal distance
-            if target_x > source_x:
-                # Target is to the right - route right and up
-                side_offset = node_width + buffer_x * 2
-                waypoint1_x = source_x + side_offset
-            else:
-                # Target is to the left - route left and up  
-                side_offset = node_width + buffer_x * 2
-                waypoint1_x = source_x - side_offset
-            
-            # First waypoint: move to the side
-            waypoint1_y = source_y
-            
-            # Second waypoint: move up to target level
-            waypoint2_x = waypoint1_x
-            waypoint2_y = target_y
-            
-            # Third waypoint: move horizontally to target
-            waypoint3_x = target_x
-            waypoint3_y = target_y
-            
-            waypoints.extend([
-                (waypoint1_x, waypoint1_y),
-                (waypoint2_x, waypoint2_y),
-                (waypoint3_x, waypoint3_y)
-            ])
-        else:
-            # Short upward connection - simple curved path
-            mid_x = source_x + (target_x - source_x) * 0.5
-            
-            # Route below source and above target for smooth curve
-            curve_offset = 40
-            waypoint1_y = source_y + curve_offset
-            waypoint2_y = target_y - curve_offset
-            
-            waypoints.extend([
-                (mid_x, waypoint1_y),
-                (mid_x, waypoint2_y)
-            ])
-    
-    def check_doxygen_available(self):
-        """Check if Doxygen is available in the system"""
-        try:
-            result = subprocess.run(['doxygen', '--version'], 
-                                  capture_output=True, text=True, check=True)
-            version = result.stdout.strip()
-            print(Colors.colored(f"✅ Found Doxygen {version}", Colors.GREEN))
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print(Colors.colored("❌ Doxygen not found in system PATH", Colors.RED))
-            print("Please install Doxygen:")
-            print("  macOS: brew install doxygen")
-            print("  Ubuntu/Debian: sudo apt-get install doxygen")
-            print("  Windows: Download from doxygen.nl")
-            return False
+        return dot_files
     
-    def check_dot_available(self):
-        """Check if Graphviz DOT is available and get its path"""
-        dot_paths_to_check = [
-            'dot',  # System PATH
-            '/usr/bin/dot',  # Common Linux location
-            '/usr/local/bin/dot',  # Common macOS homebrew location
-            '/opt/homebrew/bin/dot',  # Apple Silicon homebrew location
-            'C:\\Program Files\\Graphviz\\bin\\dot.exe',  # Windows default
-            'C:\\Program Files (x86)\\Graphviz\\bin\\dot.exe',  # Windows x86
-        ]
-        
-        # Check if user provided a custom DOT path
-        if self.dot_path:
-            dot_paths_to_check.insert(0, self.dot_path)
-        
-        for dot_path in dot_paths_to_check:
-            try:
-                result = subprocess.run([dot_path, '-V'], 
-                                      capture_output=True, text=True, check=True)
-                # DOT version info goes to stderr, not stdout
-                version_info = result.stderr.strip()
-                print(Colors.colored(f"✅ Found Graphviz DOT: {version_info}", Colors.GREEN))
-                print(Colors.colored(f"📍 DOT path: {dot_path}", Colors.CYAN))
-                return dot_path
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                continue
-        
-        print(Colors.colored("❌ Graphviz DOT not found in system PATH", Colors.RED))
-        print(Colors.colored("📝 DOT is required for generating call graphs", Colors.YELLOW))
-        print("\nPlease install Graphviz:")
-        print("  macOS: brew install graphviz")
-        print("  Ubuntu/Debian: sudo apt-get install graphviz")
-        print("  Windows: Download from graphviz.org")
-        print("\nOr specify DOT path with --dot-path option")
-        print("Common DOT locations to check:")
-        print("  /usr/bin/dot")
-        print("  /usr/local/bin/dot")
-        print("  /opt/homebrew/bin/dot (Apple Silicon Mac)")
-        print("  C:\\Program Files\\Graphviz\\bin\\dot.exe (Windows)")
-        print("\nTo find DOT on your system, try:")
-        print("  which dot        (Linux/macOS)")
-        print("  where dot        (Windows)")
-        return None
+    def clean_node_label(self, label, file_source=""):
+        """Clean and normalize node labels for multiple programming languages"""
+        cleaned = _clean_label(label) if label else ''
+
+        # Handle labels that are empty or cleaned down to nothing
+        if not cleaned:
+            return f"Node{self.node_counter}"
+        return cleaned
     
-    def find_doxyfile(self):
-        """Find existing Doxyfile in the source directory"""
-        possible_names = ['Doxyfile', 'Doxyfile.in', 'doxyfile', 'doxygen.conf', 'doxygen.cfg']
-        
-        for name in possible_names:
-            doxyfile_path = os.path.join(self.source_dir, name)
-            if os.path.exists(doxyfile_path):
-                print(Colors.colored(f"📄 Found existing Doxyfile: {doxyfile_path}", Colors.GREEN))
-                return doxyfile_path
-        
+    def normalize_label(self, label):
+        """Get the normalized form of a label, computing it at most once"""
+        norm = self._normalized_cache.get(label)
+        if norm is None:
+            norm = label.lower().strip('_').replace('_', '').replace('-', '')
+            self._normalized_cache[label] = norm
+        return norm
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _label_shingles(norm):
+        """Compute the 3-gram shingle set of a normalized label.
+
+        Cached because each label is shingled twice (candidate lookup and
+        index insertion) and duplicate labels recur across DOT files.
+        """
+        if len(norm) < 3:
+            return frozenset((norm,)) if norm else frozenset()
+        return frozenset(norm[i:i + 3] for i in range(len(norm) - 2))
+
+    def _index_label(self, clean_label):
+        """Register a newly-added label in the shingle index for fuzzy lookup"""
+        norm = self.normalize_label(clean_label)
+        for shingle in self._label_shingles(norm):
+            self._shingle_index.setdefault(shingle, []).append(clean_label)
+
+    def find_similar_node(self, clean_label, node_unique_id, file_source):
+        """Find if a similar node already exists to avoid duplicates"""
+        # First check exact label match
+        if clean_label in self.label_to_simple:
+            return self.label_to_simple[clean_label]
+
+        # Gather only labels sharing at least one 3-gram with the candidate;
+        # dissimilar labels never reach the expensive comparator
+        norm_new = self.normalize_label(clean_label)
+        candidates = set()
+        for shingle in self._label_shingles(norm_new):
+            candidates.update(self._shingle_index.get(shingle, ()))
+
+        # Check for very similar labels (fuzzy matching); sorted for a
+        # deterministic winner when several candidates match
+        for existing_label in sorted(candidates):
+            # Check if labels are very similar (accounting for minor variations)
+            if self.are_labels_similar(clean_label, existing_label,
+                                       norm_new, self.normalize_label(existing_label)):
+                return self.label_to_simple[existing_label]
+
         return None
-    
-    def create_doxyfile(self, dot_executable_path=None):
-        """Create a basic Doxyfile optimized for call graph generation"""
-        doxyfile_path = os.path.join(self.source_dir, "Doxyfile")
-        
-        # Calculate the correct output directory
-        # If doxygen_output_dir ends with /html, use the parent directory
-        # Otherwise, use doxygen_output_dir directly
-        if self.doxygen_output_dir.endswith('/html') or self.doxygen_output_dir.endswith('\\html'):
-            doxygen_output_base = os.path.dirname(self.doxygen_output_dir)
-        else:
-            doxygen_output_base = self.doxygen_output_dir
-        
-        # Ensure we have a valid output directory
-        if not doxygen_output_base:
-            doxygen_output_base = "doxygen_output"
-        
-        # Convert to absolute path to ensure it's created in the current directory, not source directory
-        if not os.path.isabs(doxygen_output_base):
-            # Get the current working directory (where the script was called from)
-            current_dir = os.getcwd()
-            doxygen_output_base = os.path.join(current_dir, doxygen_output_base)
-        
-        # Normalize the path for consistent directory separators
-        doxygen_output_base = os.path.normpath(doxygen_output_base)
-        
-        # Detect source file extensions in the directory
-        source_extensions = set()
-        common_extensions = ['.c', '.cpp', '.cxx', '.cc', '.h', '.hpp', '.hxx', '.py', '.java', '.js', '.ts']
-        
-        for root, dirs, files in os.walk(self.source_dir):
-            for file in files:
-                ext = os.path.splitext(file)[1].lower()
-                if ext in common_extensions:
-                    source_extensions.add(ext)
-        
-        # Determine project type based on files found
-        if '.py' in source_extensions:
-            project_type = "Python"
-            file_patterns = "*.py"
-        elif any(ext in source_extensions for ext in ['.cpp', '.cxx', '.cc', '.hpp', '.hxx']):
-            project_type = "C++"
-            file_patterns = "*.cpp *.cxx *.cc *.hpp *.hxx *.h"
-        elif any(ext in source_extensions for ext in ['.c', '.h']):
-            project_type = "C"
-            file_patterns = "*.c *.h"
-        elif '.java' in source_extensions:
-            project_type = "Java"
-            file_patterns = "*.java"
-        elif any(ext in source_extensions for ext in ['.js', '.ts']):
-            project_type = "JavaScript/TypeScript"
-            file_patterns = "*.js *.ts"
-        else:
-            project_type = "Multi-language"
-            file_patterns = " ".join(f"*{ext}" for ext in source_extensions)
-        
-        project_name = os.path.basename(os.path.abspath(self.source_dir))
-        
-        # Set DOT path if provided
-        if dot_executable_path and os.path.dirname(dot_executable_path):
-            dot_path_line = f"DOT_PATH               = {os.path.dirname(dot_executable_path)}"
-        else:
-            dot_path_line = "DOT_PATH               ="
-        
-        doxyfile_content = f'''# Doxyfile generated by Doxygen-to-Drawio Converter
-# Project: {project_name} ({project_type})
 
-#---------------------------------------------------------------------------
-# Project related configuration options
-#---------------------------------------------------------------------------
-DOXYFILE_ENCODING      = UTF-8
-PROJECT_NAME           = "{project_name}"
-PROJECT_NUMBER         = "1.0"
-PROJECT_BRIEF          = "Automatically generated documentation"
-OUTPUT_DIRECTORY       = {doxygen_output_base}
-CREATE_SUBDIRS         = NO
-ALLOW_UNICODE_NAMES    = NO
-OUTPUT_LANGUAGE        = English
-BRIEF_MEMBER_DESC      = YES
-REPEAT_BRIEF           = YES
-ABBREVIATE_BRIEF       = 
-ALWAYS_DETAILED_SEC    = NO
-INLINE_INHERITED_MEMB  = NO
-FULL_PATH_NAMES        = YES
-STRIP_FROM_PATH        = 
-STRIP_FROM_INC_PATH    = 
-SHORT_NAMES            = NO
-JAVADOC_AUTOBRIEF      = NO
-JAVADOC_BANNER         = NO
-QT_AUTOBRIEF           = NO
-MULTILINE_CPP_IS_BRIEF = NO
-PYTHON_DOCSTRING       = YES
-INHERIT_DOCS           = YES
-SEPARATE_MEMBER_PAGES  = NO
-TAB_SIZE               = 4
-ALIASES                = 
-OPTIMIZE_OUTPUT_FOR_C  = {'YES' if project_type == 'C' else 'NO'}
-OPTIMIZE_OUTPUT_JAVA   = {'YES' if project_type == 'Java' else 'NO'}
-OPTIMIZE_FOR_FORTRAN   = NO
-OPTIMIZE_OUTPUT_VHDL   = NO
-OPTIMIZE_OUTPUT_SLICE  = NO
-EXTENSION_MAPPING      = 
-MARKDOWN_SUPPORT       = YES
-TOC_INCLUDE_HEADINGS   = 5
-AUTOLINK_SUPPORT       = YES
-BUILTIN_STL_SUPPORT    = YES
-CPP_CLI_SUPPORT        = NO
-SIP_SUPPORT            = NO
-IDL_PROPERTY_SUPPORT   = YES
-DISTRIBUTE_GROUP_DOC   = NO
-GROUP_NESTED_COMPOUNDS = NO
-SUBGROUPING            = YES
-INLINE_GROUPED_CLASSES = NO
-INLINE_SIMPLE_STRUCTS  = NO
-TYPEDEF_HIDES_STRUCT   = NO
-LOOKUP_CACHE_SIZE      = 0
+    def are_labels_similar(self, label1, label2, norm1=None, norm2=None):
+        """Check if two labels represent the same function/node"""
+        if label1 == label2:
+            return True
 
-#---------------------------------------------------------------------------
-# Build related configuration options
-#---------------------------------------------------------------------------
-EXTRACT_ALL            = YES
-EXTRACT_PRIVATE        = YES
-EXTRACT_PRIV_VIRTUAL   = NO
-EXTRACT_PACKAGE        = NO
-EXTRACT_STATIC         = YES
-EXTRACT_LOCAL_CLASSES  = YES
-EXTRACT_LOCAL_METHODS  = NO
-EXTRACT_ANON_NSPACES   = NO
-HIDE_UNDOC_MEMBERS     = NO
-HIDE_UNDOC_CLASSES     = NO
-HIDE_FRIEND_COMPOUNDS  = NO
-HIDE_IN_BODY_DOCS      = NO
-INTERNAL_DOCS          = NO
-CASE_SENSE_NAMES       = {'YES' if project_type != 'Windows' else 'NO'}
-HIDE_SCOPE_NAMES       = NO
-HIDE_COMPOUND_REFERENCE= NO
-SHOW_INCLUDE_FILES     = YES
-SHOW_GROUPED_MEMB_INC  = NO
-FORCE_LOCAL_INCLUDES   = NO
-INLINE_INFO            = YES
-SORT_MEMBER_DOCS       = YES
-SORT_BRIEF_DOCS        = NO
-SORT_MEMBERS_CTORS_1ST = NO
-SORT_GROUP_NAMES       = NO
-SORT_BY_SCOPE_NAME     = NO
-STRICT_PROTO_MATCHING  = NO
-GENERATE_TODOLIST      = YES
-GENERATE_TESTLIST      = YES
-GENERATE_BUGLIST       = YES
-GENERATE_DEPRECATEDLIST= YES
-ENABLED_SECTIONS       = 
-MAX_INITIALIZER_LINES  = 30
-SHOW_USED_FILES        = YES
-SHOW_FILES             = YES
-SHOW_NAMESPACES        = YES
-FILE_VERSION_FILTER    = 
-LAYOUT_FILE            = 
-CITE_BIB_FILES         = 
+        # Use pre-normalized forms when the caller supplies them
+        if norm1 is None:
+            norm1 = self.normalize_label(label1)
+        if norm2 is None:
+            norm2 = self.normalize_label(label2)
 
-#---------------------------------------------------------------------------
-# Configuration options related to warning and progress messages
-#---------------------------------------------------------------------------
-QUIET                  = NO
-WARNINGS               = YES
-WARN_IF_UNDOCUMENTED   = YES
-WARN_IF_DOC_ERROR      = YES
-WARN_NO_PARAMDOC       = NO
-WARN_AS_ERROR          = NO
-WARN_FORMAT            = "$file:$line: $text"
-WARN_LOGFILE           = 
+        # Check if one is a substring of the other (for different name variations)
+        if norm1 in norm2 or norm2 in norm1:
+            # Only consider similar if the difference is not too large
+            min_len = min(len(norm1), len(norm2))
+            max_len = max(len(norm1), len(norm2))
+            if max_len <= min_len * 1.5:  # Allow 50% difference
+                return True
+        
+        # Check for common function name patterns
+        # Remove common prefixes/suffixes that might differ, in one pass
+        clean1 = _COMMON_PREFIX_RE.sub('', norm1)
+        clean2 = _COMMON_PREFIX_RE.sub('', norm2)
 
-#---------------------------------------------------------------------------
-# Configuration options related to the input files
-#---------------------------------------------------------------------------
-INPUT                  = {self.source_dir}
-INPUT_ENCODING         = UTF-8
-FILE_PATTERNS          = {file_patterns}
-RECURSIVE              = YES
-EXCLUDE                = 
-EXCLUDE_SYMLINKS       = NO
-EXCLUDE_PATTERNS       = */build/* */dist/* */.git/* */node_modules/* */__pycache__/* *.tmp */.DS_Store
-EXCLUDE_SYMBOLS        = 
-EXAMPLE_PATH           = 
-EXAMPLE_PATTERNS       = 
-EXAMPLE_RECURSIVE      = NO
-IMAGE_PATH             = 
-INPUT_FILTER           = 
-FILTER_PATTERNS        = 
-FILTER_SOURCE_FILES    = NO
-FILTER_SOURCE_PATTERNS = 
-USE_MDFILE_AS_MAINPAGE = 
+        return clean1 == clean2
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _label_priority(label):
+        """Keyword-based priority of one label; cached because the layout
+        pipeline asks for the same label during BFS and again per sort"""
+        # Function type priorities (higher = earlier in execution):
+        # best-scoring token of the label wins
+        tokens = _TOKEN_RE.split(label.lower())
+        return max((_EXECUTION_PRIORITY.get(token, 0) for token in tokens), default=0)
 
-#---------------------------------------------------------------------------
-# Configuration options related to source browsing
-#---------------------------------------------------------------------------
-SOURCE_BROWSER         = YES
-INLINE_SOURCES         = NO
-STRIP_CODE_COMMENTS    = YES
-REFERENCED_BY_RELATION = YES
-REFERENCES_RELATION    = YES
-REFERENCES_LINK_SOURCE = YES
-SOURCE_TOOLTIPS        = YES
-USE_HTAGS              = NO
-VERBATIM_HEADERS       = YES
-CLANG_ASSISTED_PARSING = NO
-CLANG_OPTIONS          = 
-CLANG_DATABASE_PATH    = 
+    def get_execution_priority(self, label, outgoing_count, incoming_count):
+        """Calculate execution priority for sequence-based ordering"""
+        priority = self._label_priority(label)
 
-#---------------------------------------------------------------------------
-# Configuration options related to the alphabetical class index
-#---------------------------------------------------------------------------
-ALPHABETICAL_INDEX     = YES
-COLS_IN_ALPHA_INDEX    = 5
-IGNORE_PREFIX          = 
+        # Connectivity-based adjustments
+        priority += min(20, outgoing_count * 2)  # Functions that call many others are orchestrators
+        priority += min(10, incoming_count)      # Popular functions are important
 
-#---------------------------------------------------------------------------
-# Configuration options related to the HTML output
-#---------------------------------------------------------------------------
-GENERATE_HTML          = YES
-HTML_OUTPUT            = html
-HTML_FILE_EXTENSION    = .html
-HTML_HEADER            = 
-HTML_FOOTER            = 
-HTML_STYLESHEET        = 
-HTML_EXTRA_STYLESHEET  = 
-HTML_EXTRA_FILES       = 
-HTML_COLORSTYLE_HUE    = 220
-HTML_COLORSTYLE_SAT    = 100
-HTML_COLORSTYLE_GAMMA  = 80
-HTML_TIMESTAMP         = NO
-HTML_DYNAMIC_MENUS     = YES
-HTML_DYNAMIC_SECTIONS  = NO
-HTML_INDEX_NUM_ENTRIES = 100
-GENERATE_DOCSET        = NO
-DOCSET_FEEDNAME        = "Doxygen generated docs"
-DOCSET_BUNDLE_ID       = org.doxygen.Project
-DOCSET_PUBLISHER_ID    = org.doxygen.Publisher
-DOCSET_PUBLISHER_NAME  = Publisher
-GENERATE_HTMLHELP      = NO
-CHM_FILE               = 
-HHC_LOCATION           = 
-GENERATE_CHI           = NO
-CHM_INDEX_ENCODING     = 
-BINARY_TOC             = NO
-TOC_EXPAND             = NO
-GENERATE_QHP           = NO
-QCH_FILE               = 
-QHP_NAMESPACE          = org.doxygen.Project
-QHP_VIRTUAL_FOLDER     = doc
-QHP_CUST_FILTER_NAME   = 
-QHP_CUST_FILTER_ATTRS  = 
-QHP_SECT_FILTER_ATTRS  = 
-QHG_LOCATION           = 
-GENERATE_ECLIPSEHELP   = NO
-ECLIPSE_DOC_ID         = org.doxygen.Project
-DISABLE_INDEX          = NO
-GENERATE_TREEVIEW      = NO
-ENUM_VALUES_PER_LINE   = 4
-TREEVIEW_WIDTH         = 250
-EXT_LINKS_IN_WINDOW    = NO
-FORMULA_FONTSIZE       = 10
-FORMULA_TRANSPARENT    = YES
-FORMULA_MACROFILE      = 
-USE_MATHJAX            = NO
-MATHJAX_FORMAT         = HTML-CSS
-MATHJAX_RELPATH        = https://cdn.jsdelivr.net/npm/mathjax@2
-MATHJAX_EXTENSIONS     = 
-MATHJAX_CODEFILE       = 
-SEARCHENGINE           = YES
-SERVER_BASED_SEARCH    = NO
-EXTERNAL_SEARCH        = NO
-SEARCHENGINE_URL       = 
-SEARCHDATA_FILE        = searchdata.xml
-EXTERNAL_SEARCH_ID     = 
-EXTRA_SEARCH_MAPPINGS  = 
+        return priority
+    
+    @staticmethod
+    def classify_function(label_lower):
+        """Classify a lowercased label into a functional group by its tokens"""
+        tokens = set(_TOKEN_RE.split(label_lower))
+        for group, keywords in _FUNCTION_GROUPS:
+            if tokens & keywords:
+                return group
+        return 'core'
 
-#---------------------------------------------------------------------------
-# Configuration options related to the LaTeX output
-#---------------------------------------------------------------------------
-GENERATE_LATEX         = NO
+    def refine_levels_by_function_type(self, levels, connected_nodes, incoming, outgoing):
+        """Refine level assignments based on functional relationships"""
+        # Group functions by type for better organization
+        function_groups = {
+            'entry': [],      # main, init functions
+            'core': [],       # primary business logic
+            'io': [],         # input/output operations
+            'processing': [], # data processing and computation
+            'utility': [],    # helper and utility functions
+            'error': [],      # error handling
+            'cleanup': []     # cleanup and finalization
+        }
+
+        # Categorize functions using the category cached at insertion time
+        for node in connected_nodes:
+            function_groups[self.nodes[node].category].append(node)
+        
+        # Bind the lookup once; these loops hit levels.get for every node and
+        # every parent below
+        get_level = levels.get
+
+        # Adjust levels to create logical flow
+        # Entry functions should be at the top
+        min_entry_level = min((get_level(node, 0) for node in function_groups['entry']), default=0)
+
+        # Error handling functions should be grouped together but not necessarily at the end
+        if function_groups['error']:
+            error_target_level = max(2, min_entry_level + 2)
+            for node in function_groups['error']:
+                # Move error handlers closer together but respect dependencies
+                if get_level(node, 0) > error_target_level + 1:
+                    # Only move if it doesn't violate dependencies
+                    can_move = all(get_level(parent, 0) < error_target_level for parent in incoming[node])
+                    if can_move:
+                        levels[node] = error_target_level
+
+        # Cleanup functions should generally be later in the flow
+        if function_groups['cleanup']:
+            cleanup_base_level = max(get_level(node, 0) for node in connected_nodes) - 1
+            for node in function_groups['cleanup']:
+                if get_level(node, 0) < cleanup_base_level:
+                    # Only move if it doesn't violate dependencies
+                    can_move = all(get_level(parent, 0) < cleanup_base_level for parent in incoming[node])
+                    if can_move:
+                        levels[node] = cleanup_base_level
+    
+    def get_function_category_order(self, label):
+        """Get ordering value for function categories (lower = left, higher = right)"""
+        # Left to right ordering within a level (execution sequence):
+        # earliest category among the label's tokens wins, default is the
+        # middle (processing) category
+        tokens = _TOKEN_RE.split(label.lower())
+        order = min((_CATEGORY_ORDER.get(token, 16) for token in tokens), default=16)
+        return 6 if order == 16 else order
+    
+    def get_edge_style(self, source_label, target_label, source_x, source_y, target_x, target_y):
+        """Determine edge style based on execution sequence and function relationships with enhanced routing"""
+        # Calculate distance for style decisions
+        x_distance = abs(target_x - source_x)
+
+        # Determine function relationship types - the per-label scans are
+        # memoized, so a node participating in many edges is classified once
+        is_main_entry = _edge_source_is_entry(source_label)
+        target_cats = _edge_target_categories(target_label)
+
+        # Map direction + labels onto one of the precomputed style constants;
+        # each direction walks its categories in fixed priority order
+        if target_y > source_y:
+            # Main execution flow (top to bottom); edges from main/init
+            # functions form the critical path regardless of target
+            direction = 'down'
+            if is_main_entry:
+                category = 'main'
+            elif 'error' in target_cats:
+                category = 'error'
+            elif 'io' in target_cats:
+                category = 'io'
+            elif 'cleanup' in target_cats:
+                category = 'cleanup'
+            else:
+                category = None
+            long_distance = x_distance > 300
+        elif target_y < source_y:
+            # Feedback, callbacks, or recursive calls
+            direction = 'up'
+            category = 'error' if 'error' in target_cats else None
+            long_distance = False
+        else:
+            # Same-level function calls - curved routing for longer hops
+            direction = 'lateral'
+            if 'error' in target_cats:
+                category = 'error'
+            elif 'utility' in target_cats:
+                category = 'utility'
+            elif 'timing' in target_cats:
+                category = 'timing'
+            elif 'io' in target_cats:
+                category = 'io'
+            else:
+                category = None
+            long_distance = x_distance > 200
+
+        return _EDGE_STYLES[(direction, category, long_distance)]
+    
+    def _execution_waypoints(self, source_x, source_y, target_x, target_y,
+                             source_label, target_label, max_node_width):
+        """Compute intelligent waypoints for better execution flow visualization
+        with node collision avoidance; returns a list of (x, y) points"""
+
+        # Calculate distances and decide if waypoints are needed
+        x_distance = abs(target_x - source_x)
+        y_distance = abs(target_y - source_y)
+        
+        # Estimate node dimensions for collision avoidance
+        node_width = max_node_width
+        node_height = 80  # Estimated average node height
+        
+        # Add buffer space around nodes
+        buffer_x = 30
+        buffer_y = 20
+        
+        waypoints = []
+        
+        # Determine connection type and optimal routing
+        if target_y == source_y:
+            # Same level (horizontal) connections; the memoized classifier
+            # scans each distinct target label at most once
+            target_cats = _edge_target_categories(target_label)
+            self._add_horizontal_waypoints(waypoints, source_x, source_y, target_x, target_y,
+                                         target_cats, node_width, node_height,
+                                         buffer_x, buffer_y)
+        elif target_y > source_y:
+            # Downward flow (normal execution)
+            self._add_downward_waypoints(waypoints, source_x, source_y, target_x, target_y,
+                                       source_label, target_label, node_width, node_height,
+                                       buffer_x, buffer_y, x_distance, y_distance)
+        else:
+            # Upward flow (callbacks, recursion)
+            self._add_upward_waypoints(waypoints, source_x, source_y, target_x, target_y,
+                                     source_label, target_label, node_width, node_height,
+                                     buffer_x, buffer_y, x_distance, y_distance)
+        
+        return [(int(x), int(y)) for x, y in waypoints]
+    
+    def _add_horizontal_waypoints(self, waypoints, source_x, source_y, target_x, target_y,
+                                target_cats, node_width, node_height, buffer_x, buffer_y):
+        """Add waypoints for horizontal (same-level) connections"""
+        x_distance = abs(target_x - source_x)
 
-#---------------------------------------------------------------------------
-# Configuration options related to the RTF output
-#---------------------------------------------------------------------------
-GENERATE_RTF           = NO
+        # Only add waypoints for longer horizontal connections
+        if x_distance > node_width * 1.5:
+            # Determine routing preference based on function type, walking
+            # the categories in fixed priority order
+            offset_y = -50  # Default offset above nodes
 
-#---------------------------------------------------------------------------
-# Configuration options related to the man page output
-#---------------------------------------------------------------------------
-GENERATE_MAN           = NO
+            if 'error' in target_cats:
+                offset_y = -60  # Route error calls higher above
+            elif 'cleanup' in target_cats:
+                offset_y = 60  # Route cleanup calls below
+            elif 'utility' in target_cats:
+                offset_y = -40  # Route utility calls slightly above
+            
+            # Calculate waypoint positions
+            if x_distance > node_width * 3:
+                # Long horizontal connection - use multiple waypoints for smoother curve
+                quarter_x = source_x + (target_x - source_x) * 0.25
+                mid_x = source_x + (target_x - source_x) * 0.5
+                three_quarter_x = source_x + (target_x - source_x) * 0.75
+                
+                waypoint_y = source_y + offset_y
+                
+                waypoints.extend([
+                    (quarter_x, waypoint_y),
+                    (mid_x, waypoint_y),
+                    (three_quarter_x, waypoint_y)
+                ])
+            else:
+                # Medium horizontal connection - use single waypoint
+                mid_x = source_x + (target_x - source_x) * 0.5
+                waypoint_y = source_y + offset_y
+                waypoints.append((mid_x, waypoint_y))
+    
+    def _add_downward_waypoints(self, waypoints, source_x, source_y, target_x, target_y,
+                              source_label, target_label, node_width, node_height, 
+                              buffer_x, buffer_y, x_distance, y_distance):
+        """Add waypoints for downward (normal execution) flow"""
+        
+        # For large horizontal offsets in downward flow, create stepped routing
+        if x_distance > node_width * 2:
+            # Step down and across to avoid crossing other nodes
+            
+            # First waypoint: step down from source
+            waypoint1_x = source_x
+            waypoint1_y = source_y + node_height + buffer_y
+            
+            # Second waypoint: move horizontally at intermediate level
+            waypoint2_x = target_x
+            waypoint2_y = waypoint1_y
+            
+            # Third waypoint: step down to target level if there's still distance
+            if y_distance > (node_height + buffer_y * 2):
+                waypoint3_x = target_x
+                waypoint3_y = target_y - node_height // 2 - buffer_y
+                waypoints.extend([
+                    (waypoint1_x, waypoint1_y),
+                    (waypoint2_x, waypoint2_y),
+                    (waypoint3_x, waypoint3_y)
+                ])
+            else:
+                waypoints.extend([
+                    (waypoint1_x, waypoint1_y),
+                    (waypoint2_x, waypoint2_y)
+                ])
+        elif x_distance > node_width * 0.8:
+            # Medium horizontal offset - single intermediate waypoint
+            mid_x = source_x + (target_x - source_x) * 0.7
+            mid_y = source_y + y_distance * 0.6
+            waypoints.append((mid_x, mid_y))
+    
+    def _add_upward_waypoints(self, waypoints, source_x, source_y, target_x, target_y,
+                            source_label, target_label, node_width, node_height,
+                            buffer_x, buffer_y, x_distance, y_distance):
+        """Add waypoints for upward (callback/recursion) flow"""
+        
+        # Upward flow needs special handling to avoid crossing nodes
+        if x_distance > node_width:
+            # Route around the side to avoid crossing intermediate nodes
+            
+            # Determine which side to route around based on horizontal distance
+            if target_x > source_x:
+                # Target is to the right - route right and up
+                side_offset = node_width + buffer_x * 2
+                waypoint1_x = source_x + side_offset
+            else:
+                # Target is to the left - route left and up  
+                side_offset = node_width + buffer_x * 2
+                waypoint1_x = source_x - side_offset
+            
+            # First waypoint: move to the side
+            waypoint1_y = source_y
+            
+            # Second waypoint: move up to target level
+            waypoint2_x = waypoint1_x
+            waypoint2_y = target_y
+            
+            # Third waypoint: move horizontally to target
+            waypoint3_x = target_x
+            waypoint3_y = target_y
+            
+            waypoints.extend([
+                (waypoint1_x, waypoint1_y),
+                (waypoint2_x, waypoint2_y),
+                (waypoint3_x, waypoint3_y)
+            ])
+        else:
+            # Short upward connection - simple curved path
+            mid_x = source_x + (target_x - source_x) * 0.5
+            
+            # Route below source and above target for smooth curve
+            curve_offset = 40
+            waypoint1_y = source_y + curve_offset
+            waypoint2_y = target_y - curve_offset
+            
+            waypoints.extend([
+                (mid_x, waypoint1_y),
+                (mid_x, waypoint2_y)
+            ])
+    
+    def check_doxygen_available(self):
+        """Check if Doxygen is available in the system"""
+        version = _doxygen_version()
+        if version is not None:
+            print(Colors.colored(f"✅ Found Doxygen {version}", Colors.GREEN))
+            return True
+        print(Colors.colored("❌ Doxygen not found in system PATH", Colors.RED))
+        print("Please install Doxygen:")
+        print("  macOS: brew install doxygen")
+        print("  Ubuntu/Debian: sudo apt-get install doxygen")
+        print("  Windows: Download from doxygen.nl")
+        return False
 
-#---------------------------------------------------------------------------
-# Configuration options related to the XML output
-#---------------------------------------------------------------------------
-GENERATE_XML           = NO
+    def check_dot_available(self):
+        """Check if Graphviz DOT is available and get its path"""
+        resolved = _resolve_dot(self.dot_path)
+        if resolved is not None:
+            dot_path, version_info = resolved
+            print(Colors.colored(f"✅ Found Graphviz DOT: {version_info}", Colors.GREEN))
+            print(Colors.colored(f"📍 DOT path: {dot_path}", Colors.CYAN))
+            return dot_path
 
-#---------------------------------------------------------------------------
-# Configuration options related to the DOCBOOK output
-#---------------------------------------------------------------------------
-GENERATE_DOCBOOK       = NO
+        print(Colors.colored("❌ Graphviz DOT not found in system PATH", Colors.RED))
+        print(Colors.colored("📝 DOT is required for generating call graphs", Colors.YELLOW))
+        print("\nPlease install Graphviz:")
+        print("  macOS: brew install graphviz")
+        print("  Ubuntu/Debian: sudo apt-get install graphviz")
+        print("  Windows: Download from graphviz.org")
+        print("\nOr specify DOT path with --dot-path option")
+        print("Common DOT locations to check:")
+        print("  /usr/bin/dot")
+        print("  /usr/local/bin/dot")
+        print("  /opt/homebrew/bin/dot (Apple Silicon Mac)")
+        print("  C:\\Program Files\\Graphviz\\bin\\dot.exe (Windows)")
+        print("\nTo find DOT on your system, try:")
+        print("  which dot        (Linux/macOS)")
+        print("  where dot        (Windows)")
+        return None
+    
+    def _remember_doxyfile(self, doxyfile_path):
+        """Cache the dir/name split of the Doxyfile path, recomputing only
+        when the path changes"""
+        if doxyfile_path != self._doxyfile_path:
+            self._doxyfile_path = doxyfile_path
+            self._doxyfile_dir = os.path.dirname(doxyfile_path) or self.source_dir
+            self._doxyfile_name = os.path.basename(doxyfile_path)
 
-#---------------------------------------------------------------------------
-# Configuration options for the AutoGen Definitions output
-#---------------------------------------------------------------------------
-GENERATE_AUTOGEN_DEF   = NO
+    def find_doxyfile(self):
+        """Find existing Doxyfile in the source directory"""
+        possible_names = ['Doxyfile', 'Doxyfile.in', 'doxyfile', 'doxygen.conf', 'doxygen.cfg']
 
-#---------------------------------------------------------------------------
-# Configuration options related to the Perl module output
-#---------------------------------------------------------------------------
-GENERATE_PERLMOD       = NO
+        # One directory enumeration instead of a stat per candidate name
+        try:
+            with os.scandir(self.source_dir) as entries:
+                existing = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except OSError:
+            return None
 
-#---------------------------------------------------------------------------
-# Configuration options related to the preprocessor
-#---------------------------------------------------------------------------
-ENABLE_PREPROCESSING   = YES
-MACRO_EXPANSION        = NO
-EXPAND_ONLY_PREDEF     = NO
-SEARCH_INCLUDES        = YES
-INCLUDE_PATH           = 
-INCLUDE_FILE_PATTERNS  = 
-PREDEFINED             = 
-EXPAND_AS_DEFINED      = 
-SKIP_FUNCTION_MACROS   = YES
+        for name in possible_names:
+            if name in existing:
+                doxyfile_path = existing[name]
+                print(Colors.colored(f"📄 Found existing Doxyfile: {doxyfile_path}", Colors.GREEN))
+                return doxyfile_path
 
-#---------------------------------------------------------------------------
-# Configuration options related to external references
-#---------------------------------------------------------------------------
-TAGFILES               = 
-GENERATE_TAGFILE       = 
-ALLEXTERNALS           = NO
-EXTERNAL_GROUPS        = YES
-EXTERNAL_PAGES         = YES
+        return None
+    
+    def create_doxyfile(self, dot_executable_path=None):
+        """Create a basic Doxyfile optimized for call graph generation"""
+        doxyfile_path = os.path.join(self.source_dir, "Doxyfile")
+        
+        # Calculate the correct output directory
+        # If doxygen_output_dir ends with /html, use the parent directory
+        # Otherwise, use doxygen_output_dir directly
+        if self.doxygen_output_dir.endswith('/html') or self.doxygen_output_dir.endswith('\\html'):
+            doxygen_output_base = os.path.dirname(self.doxygen_output_dir)
+        else:
+            doxygen_output_base = self.doxygen_output_dir
+        
+        # Ensure we have a valid output directory
+        if not doxygen_output_base:
+            doxygen_output_base = "doxygen_output"
+        
+        # Convert to absolute path to ensure it's created in the current directory, not source directory
+        # (cached working directory - where the script was called from)
+        if not os.path.isabs(doxygen_output_base):
+            doxygen_output_base = os.path.join(self._cwd, doxygen_output_base)
 
-#---------------------------------------------------------------------------
-# Configuration options related to the dot tool (CRITICAL FOR CALL GRAPHS)
-#---------------------------------------------------------------------------
-CLASS_DIAGRAMS         = YES
-DIA_PATH               = 
-HIDE_UNDOC_RELATIONS   = YES
-HAVE_DOT               = {'YES' if dot_executable_path else 'NO'}
-DOT_NUM_THREADS        = 0
-DOT_FONTNAME           = Helvetica
-DOT_FONTSIZE           = 10
-DOT_FONTPATH           = 
-{dot_path_line}
-CLASS_GRAPH            = YES
-COLLABORATION_GRAPH    = YES
-GROUP_GRAPHS           = YES
-UML_LOOK               = NO
-UML_LIMIT_NUM_FIELDS   = 10
-TEMPLATE_RELATIONS     = NO
-INCLUDE_GRAPH          = YES
-INCLUDED_BY_GRAPH      = YES
-CALL_GRAPH             = {'YES' if dot_executable_path else 'NO'}
-CALLER_GRAPH           = {'YES' if dot_executable_path else 'NO'}
-GRAPHICAL_HIERARCHY    = YES
-DIRECTORY_GRAPH        = YES
-DOT_IMAGE_FORMAT       = png
-INTERACTIVE_SVG        = NO
-DOTFILE_DIRS           = 
-MSCFILE_DIRS           = 
-DIAFILE_DIRS           = 
-PLANTUML_JAR_PATH      = 
-PLANTUML_CFG_FILE      = 
-PLANTUML_INCLUDE_PATH  = 
-DOT_GRAPH_MAX_NODES    = 50
-MAX_DOT_GRAPH_DEPTH    = 0
-DOT_TRANSPARENT        = NO
-DOT_MULTI_TARGETS      = NO
-GENERATE_LEGEND        = YES
-DOT_CLEANUP            = NO
-'''
+        # Normalize the path for consistent directory separators; skip the
+        # normpath pass when the path is already clean
+        if ('..' in doxygen_output_base or os.sep * 2 in doxygen_output_base
+                or (os.altsep and os.altsep in doxygen_output_base)):
+            doxygen_output_base = os.path.normpath(doxygen_output_base)
+        
+        # Detect source file extensions with an iterative scandir walk; the
+        # DirEntry type info avoids a stat per file and the walk stops as
+        # soon as every known extension has been observed
+        source_extensions = set()
+
+        needed = set().union(*_EXT_BY_LAST_CHAR.values())
+        stack = [self.source_dir]
+        while stack and needed:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _PRUNE_DIRS:
+                                stack.append(entry.path)
+                            continue
+                        # Bucket by the name's last character first - most
+                        # files bail on one dict probe without the splitext
+                        # slice-and-lower allocation
+                        candidates = _EXT_BY_LAST_CHAR.get(entry.name[-1:].lower())
+                        if not candidates:
+                            continue
+                        lower_name = entry.name.lower()
+                        for ext in candidates:
+                            if (ext in needed and len(lower_name) > len(ext)
+                                    and lower_name.endswith(ext)):
+                                source_extensions.add(ext)
+                                needed.discard(ext)
+                                break
+                        if not needed:
+                            break
+            except OSError:
+                continue
+        
+        # Determine project type based on files found
+        for name, signature, patterns in _LANG_SIGNATURES:
+            if source_extensions & signature:
+                project_type = name
+                file_patterns = patterns
+                break
+        else:
+            project_type = "Multi-language"
+            file_patterns = " ".join(f"*{ext}" for ext in source_extensions)
+        
+        project_name = os.path.basename(os.path.abspath(self.source_dir))
+        
+        # Set DOT path if provided
+        if dot_executable_path and os.path.dirname(dot_executable_path):
+            dot_path_line = f"DOT_PATH               = {os.path.dirname(dot_executable_path)}"
+        else:
+            dot_path_line = "DOT_PATH               ="
+        
+        doxyfile_content = _doxyfile_skeleton(project_type, bool(dot_executable_path)).format_map({
+            'project_name': project_name,
+            'doxygen_output_base': doxygen_output_base,
+            'source_dir': self.source_dir,
+            'file_patterns': file_patterns,
+            'dot_path_line': dot_path_line,
+        })
         
         try:
-            with open(doxyfile_path, 'w', encoding='utf-8') as f:
-                f.write(doxyfile_content)
+            # Single binary write of the pre-encoded buffer; skips the
+            # TextIOWrapper incremental-encoding layer
+            with open(doxyfile_path, 'wb') as f:
+                f.write(doxyfile_content.encode('utf-8'))
             print(Colors.colored(f"📝 Created Doxyfile: {doxyfile_path}", Colors.GREEN))
             print(Colors.colored(f"🎯 Optimized for {project_type} project with call graph generation", Colors.CYAN))
             if dot_executable_path:
@@ -1026,32 +1571,50 @@ DOT_CLEANUP            = NO
             else:
                 updates['DOT_PATH'] = ""  # Ensure DOT_PATH is empty if no DOT found
             
-            modified = False
+            # Rewrite in a single pass over the lines: extract each line's
+            # left-hand key and look it up in updates, instead of running a
+            # full-file regex substitution per setting
+            seen = set()
+            out_lines = []
+            for line in content.splitlines():
+                prefix, sep, _ = line.partition('=')
+                key = prefix.strip() if sep else None
+                if key in updates:
+                    out_lines.append(f'{prefix}= {updates[key]}')
+                    seen.add(key)
+                else:
+                    out_lines.append(line)
+
+            modified = True
             for setting, value in updates.items():
-                # Look for the setting in the file
-                pattern = rf'^(\s*{setting}\s*=\s*).*$'
-                replacement = f'\\g<1>{value}'
-                
-                new_content, count = re.subn(pattern, replacement, content, flags=re.MULTILINE)
-                if count > 0:
-                    content = new_content
-                    modified = True
+                if setting in seen:
                     print(f"  ✓ Updated {setting} = {value}")
                 else:
                     # Setting not found, add it
-                    content += f'\n{setting} = {value}\n'
-                    modified = True
+                    out_lines.append(f'{setting} = {value}')
                     print(f"  + Added {setting} = {value}")
+
+            content = '\n'.join(out_lines) + '\n'
             
             if modified:
-                # Create backup
+                # Create backup; a hardlink is metadata-only (no data copy),
+                # with copy2 as fallback for filesystems without link support
                 backup_path = doxyfile_path + '.backup'
-                shutil.copy2(doxyfile_path, backup_path)
+                try:
+                    if os.path.exists(backup_path):
+                        os.remove(backup_path)
+                    os.link(doxyfile_path, backup_path)
+                except OSError:
+                    import shutil
+                    shutil.copy2(doxyfile_path, backup_path)
                 print(f"  💾 Backup created: {backup_path}")
-                
-                # Write updated content
-                with open(doxyfile_path, 'w', encoding='utf-8') as f:
+
+                # Write updated content to a temp file and swap it in
+                # atomically; the backup hardlink keeps the old data
+                tmp_path = doxyfile_path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
                     f.write(content)
+                os.replace(tmp_path, doxyfile_path)
                 print(Colors.colored(f"✅ Doxyfile updated successfully", Colors.GREEN))
                 if dot_executable_path:
                     print(Colors.colored(f"🔗 Configured with DOT path: {dot_executable_path}", Colors.CYAN))
@@ -1068,34 +1631,65 @@ DOT_CLEANUP            = NO
     
     def run_doxygen_process(self, doxyfile_path):
         """Run Doxygen to generate documentation and call graphs"""
+        import subprocess
         print(Colors.colored(f"🚀 Running Doxygen...", Colors.YELLOW))
         
         try:
-            # Change to the directory containing the Doxyfile
-            work_dir = os.path.dirname(doxyfile_path) or self.source_dir
-            doxyfile_name = os.path.basename(doxyfile_path)
+            # Change to the directory containing the Doxyfile; the dir/name
+            # split is cached per path
+            self._remember_doxyfile(doxyfile_path)
+            work_dir = self._doxyfile_dir
+            doxyfile_name = self._doxyfile_name
             
-            # Run Doxygen
-            result = subprocess.run(
+            # Run Doxygen, streaming stderr line-by-line: only the first few
+            # warnings are shown, so there is no point buffering what can be
+            # megabytes of warning output in memory
+            process = subprocess.Popen(
                 ['doxygen', doxyfile_name],
                 cwd=work_dir,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minute timeout
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True
             )
-            
-            if result.returncode == 0:
+            warning_lines = []
+            extra_warnings = [0]
+
+            # Drain stderr from a thread so the 5-minute bound below covers
+            # the whole run - reading inline would block until Doxygen
+            # closes stderr, leaving the timeout to guard only the final
+            # exit and never firing on a hang
+            def _drain_stderr():
+                with process.stderr:
+                    for line in process.stderr:
+                        if not line.strip():
+                            continue
+                        if len(warning_lines) < 5:  # Keep first 5 warnings
+                            warning_lines.append(line.rstrip('\n'))
+                        else:
+                            extra_warnings[0] += 1
+
+            import threading
+            reader = threading.Thread(target=_drain_stderr, daemon=True)
+            reader.start()
+            try:
+                returncode = process.wait(timeout=300)  # 5 minute timeout
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+            reader.join()
+            extra_warnings = extra_warnings[0]
+
+            if returncode == 0:
                 print(Colors.colored(f"✅ Doxygen completed successfully", Colors.GREEN))
-                
+
                 # Check for warnings
-                if result.stderr:
-                    warning_lines = [line for line in result.stderr.split('\n') if line.strip()]
-                    if warning_lines:
-                        print(Colors.colored(f"⚠️  Doxygen warnings:", Colors.YELLOW))
-                        for line in warning_lines[:5]:  # Show first 5 warnings
-                            print(f"  {line}")
-                        if len(warning_lines) > 5:
-                            print(f"  ... and {len(warning_lines) - 5} more warnings")
+                if warning_lines:
+                    print(Colors.colored(f"⚠️  Doxygen warnings:", Colors.YELLOW))
+                    for line in warning_lines:
+                        print(f"  {line}")
+                    if extra_warnings:
+                        print(f"  ... and {extra_warnings} more warnings")
                 
                 # Update output directory to point to generated files
                 # Calculate the expected output path based on doxygen_output_dir
@@ -1106,38 +1700,43 @@ DOT_CLEANUP            = NO
                     doxygen_output_base = self.doxygen_output_dir
                     expected_html_dir = os.path.join(self.doxygen_output_dir, 'html')
                 
-                # Convert to absolute path if relative - use current working directory, not source directory
+                # Convert to absolute path if relative - use the cached working
+                # directory, not source directory
                 if not os.path.isabs(expected_html_dir):
-                    current_dir = os.getcwd()
-                    expected_html_dir = os.path.join(current_dir, expected_html_dir)
+                    expected_html_dir = os.path.join(self._cwd, expected_html_dir)
                 if not os.path.isabs(doxygen_output_base):
-                    current_dir = os.getcwd()
-                    doxygen_output_base = os.path.join(current_dir, doxygen_output_base)
+                    doxygen_output_base = os.path.join(self._cwd, doxygen_output_base)
                 
-                if os.path.exists(expected_html_dir):
-                    self.doxygen_output_dir = expected_html_dir
-                    print(Colors.colored(f"📁 Doxygen output: {expected_html_dir}", Colors.CYAN))
-                    return True
-                else:
+                # EAFP: one stat instead of an exists probe plus the
+                # later access, and no TOCTOU window
+                try:
+                    os.stat(expected_html_dir)
+                except OSError:
                     print(Colors.colored(f"❌ Expected output directory not found: {expected_html_dir}", Colors.RED))
                     # Try to list what was actually created
                     abs_base = doxygen_output_base  # Already converted to absolute path above
-                    
-                    if os.path.exists(abs_base):
+                    try:
+                        with os.scandir(abs_base) as entries:
+                            subdirs = [entry.name for entry in entries if entry.is_dir()]
+                    except OSError:
+                        subdirs = None
+                    if subdirs is not None:
                         print(f"Available directories in {abs_base}:")
-                        try:
-                            for item in os.listdir(abs_base):
-                                item_path = os.path.join(abs_base, item)
-                                if os.path.isdir(item_path):
-                                    print(f"  - {item}/")
-                        except OSError:
-                            pass
+                        for name in subdirs:
+                            print(f"  - {name}/")
                     return False
+
+                self.doxygen_output_dir = expected_html_dir
+                print(Colors.colored(f"📁 Doxygen output: {expected_html_dir}", Colors.CYAN))
+                return True
             else:
-                print(Colors.colored(f"❌ Doxygen failed with return code {result.returncode}", Colors.RED))
-                if result.stderr:
+                print(Colors.colored(f"❌ Doxygen failed with return code {returncode}", Colors.RED))
+                if warning_lines:
                     print("Error output:")
-                    print(result.stderr)
+                    for line in warning_lines:
+                        print(line)
+                    if extra_warnings:
+                        print(f"... and {extra_warnings} more lines")
                 return False
                 
         except subprocess.TimeoutExpired:
@@ -1177,8 +1776,9 @@ DOT_CLEANUP            = NO
         
         # Look for existing Doxyfile
         doxyfile_path = self.find_doxyfile()
-        
+
         if doxyfile_path:
+            self._remember_doxyfile(doxyfile_path)
             # Update existing Doxyfile for call graph generation
             if not self.update_doxyfile_for_callgraph(doxyfile_path, dot_executable_path):
                 return False
@@ -1188,6 +1788,7 @@ DOT_CLEANUP            = NO
             doxyfile_path = self.create_doxyfile(dot_executable_path)
             if not doxyfile_path:
                 return False
+            self._remember_doxyfile(doxyfile_path)
         
         # Run Doxygen
         if not self.run_doxygen_process(doxyfile_path):
@@ -1197,8 +1798,15 @@ DOT_CLEANUP            = NO
         
         # Check if we actually got DOT files for call graphs
         if dot_executable_path:
-            dot_files = glob.glob(os.path.join(self.doxygen_output_dir, "*.dot"))
-            if not dot_files:
+            # Short-circuits on the first .dot entry instead of globbing
+            # the whole directory into a list
+            try:
+                with os.scandir(self.doxygen_output_dir) as entries:
+                    has_dot_files = any(entry.name.endswith('.dot') and entry.is_file()
+                                        for entry in entries)
+            except OSError:
+                has_dot_files = False
+            if not has_dot_files:
                 print(Colors.colored(f"⚠️  Warning: No DOT files generated despite DOT being available", Colors.YELLOW))
                 print("This might be because your source code doesn't have function calls,")
                 print("or the DOT graph limits were exceeded. The script will continue with")
@@ -1208,132 +1816,108 @@ DOT_CLEANUP            = NO
     
     def process_single_dot_file(self, dot_file_path):
         """Process a single DOT file and extract nodes and edges"""
-        try:
-            with open(dot_file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-        except (UnicodeDecodeError, IOError) as e:
-            print(f"Warning: Could not read {dot_file_path}: {e}")
-            return
-        
-        # Check if file contains valid digraph content
-        if not re.search(r'digraph\s+', content):
-            print(f"Warning: {dot_file_path} does not appear to be a valid DOT file. Skipping.")
-            return
-        
         file_basename = os.path.basename(dot_file_path)
-        print(f"Processing: {file_basename}")
-        
+
         # Skip directory dependency graphs - focus on function call graphs
         if 'dep.dot' in file_basename or 'dir_' in file_basename:
+            print(f"Processing: {file_basename}")
             print(f"  Skipping directory dependency graph: {file_basename}")
             return
-        
-        # Extract nodes with comprehensive pattern matching for function call graphs
-        # Handle various Doxygen DOT formats for function nodes
-        node_patterns = [
-            # Standard Doxygen function node format: Node1 [id="Node000001",label="function_name"...]
-            re.compile(r'(Node\d+)\s*\[id="([^"]*)",\s*label="([^"]+)"[^]]*\]', re.DOTALL),
-            # Alternative format: NodeName [label="function_name"...]
-            re.compile(r'(\w+)\s*\[\s*label="([^"]+)"[^]]*\]', re.DOTALL),
-            # More comprehensive format with id and label
-            re.compile(r'(\w+)\s*\[\s*id="([^"]*)"[^]]*label="([^"]+)"[^]]*\]', re.DOTALL),
-            # Handle nodes without explicit id field
-            re.compile(r'(\w+)\s*\[([^]]*label="([^"]+)")[^]]*\]', re.DOTALL)
-        ]
-        
+
+        self.merge_parsed_file(dot_file_path, parse_dot_file(dot_file_path))
+
+    def merge_parsed_file(self, dot_file_path, parse_result):
+        """Merge the raw nodes/edges parsed from one DOT file into the graph"""
+        status, raw_nodes, raw_edges = parse_result
+        # Interned: stored in every NodeInfo and in many original_to_simple
+        # keys, so duplicates collapse and hashing is identity-based
+        file_basename = sys.intern(os.path.basename(dot_file_path))
+
+        if status == 'error':
+            print(f"Warning: Could not read {dot_file_path}: {raw_nodes}")
+            return
+        if status == 'invalid':
+            print(f"Warning: {dot_file_path} does not appear to be a valid DOT file. Skipping.")
+            return
+
+        print(f"Processing: {file_basename}")
+
         nodes_found = 0
         processed_nodes = set()  # Avoid duplicates within the same file
-        
-        for pattern_idx, pattern in enumerate(node_patterns):
-            for match in pattern.finditer(content):
-                groups = match.groups()
-                
-                if pattern_idx == 0:  # Standard Node format
-                    original_node_id, node_unique_id, node_label = groups
-                elif pattern_idx == 1:  # Simple label format
-                    original_node_id, node_label = groups
-                    node_unique_id = original_node_id
-                elif pattern_idx == 2:  # Full format with id
-                    original_node_id, node_unique_id, node_label = groups
-                else:  # Pattern 3 - complex parsing
-                    original_node_id, middle_part, node_label = groups
-                    node_unique_id = original_node_id
-                
-                # Skip if we've already processed this node in this file
-                node_key = f"{file_basename}::{original_node_id}"
-                if node_key in processed_nodes:
-                    continue
-                processed_nodes.add(node_key)
-                
-                # Clean up the label
-                clean_label = self.clean_node_label(node_label, file_basename)
-                
-                # Skip empty or invalid labels
-                if not clean_label or clean_label.lower() in ['node', 'graph', 'cluster']:
-                    continue
-                
-                # Enhanced deduplication: check for existing similar nodes
-                similar_node_id = self.find_similar_node(clean_label, node_unique_id, file_basename)
-                
-                if similar_node_id:
-                    # Reuse existing similar node
-                    simple_node_id = similar_node_id
-                    print(f"    Merged duplicate: '{node_label}' -> '{clean_label}' (reusing {simple_node_id})")
-                else:
-                    # Create new node
-                    simple_node_id = f"node-{self.node_counter}"
-                    self.label_to_simple[clean_label] = simple_node_id
-                    self.simple_to_label[simple_node_id] = clean_label
-                    self.file_sources[simple_node_id] = file_basename
-                    self.node_counter += 1
-                
-                # Map original ID to the simple ID (possibly deduplicated)
-                full_original_id = f"{file_basename}::{original_node_id}"
-                self.original_to_simple[full_original_id] = simple_node_id
-                self.original_to_simple[original_node_id] = simple_node_id  # Also map without file prefix
-                nodes_found += 1
-        
-        # Extract edges with multiple patterns for function call graphs
-        edge_patterns = [
-            # Standard format: Node1 -> Node2
-            re.compile(r'(Node\d+)\s*->\s*(Node\d+)(?:\s*\[[^\]]*\])?'),
-            # Alternative format: source -> target
-            re.compile(r'(\w+)\s*->\s*(\w+)(?:\s*\[[^\]]*\])?'),
-        ]
-        
+
+        # Local aliases for the hot loop; original_to_simple is only read by
+        # the edge pass below, so its stores are collected and applied in one
+        # bulk update after the loop
+        label_to_simple = self.label_to_simple
+        nodes = self.nodes
+        new_original_mappings = []
+
+        for original_node_id, node_unique_id, node_label in raw_nodes:
+            # Skip if we've already processed this node in this file
+            node_key = f"{file_basename}::{original_node_id}"
+            if node_key in processed_nodes:
+                continue
+            processed_nodes.add(node_key)
+
+            # Clean up the label
+            clean_label = self.clean_node_label(node_label, file_basename)
+
+            # Skip empty or invalid labels
+            if not clean_label or clean_label.lower() in ['node', 'graph', 'cluster']:
+                continue
+
+            # Enhanced deduplication: check for existing similar nodes
+            similar_node_id = self.find_similar_node(clean_label, node_unique_id, file_basename)
+
+            if similar_node_id:
+                # Reuse existing similar node
+                simple_node_id = similar_node_id
+                print(f"    Merged duplicate: '{node_label}' -> '{clean_label}' (reusing {simple_node_id})")
+            else:
+                # Create new node
+                # Interned so every edge tuple and mapping that refers to
+                # this node shares one string object
+                simple_node_id = sys.intern(f"node-{self.node_counter}")
+                label_to_simple[clean_label] = simple_node_id
+                self._index_label(clean_label)
+                nodes[simple_node_id] = NodeInfo(
+                    clean_label, self.classify_function(clean_label.lower()), file_basename)
+                self.adj_out[simple_node_id] = {}
+                self.adj_in[simple_node_id] = {}
+                self.node_counter += 1
+
+            # Map original ID to the simple ID (possibly deduplicated),
+            # both with and without the file prefix (node_key is already
+            # the prefixed form)
+            new_original_mappings.append((node_key, simple_node_id))
+            new_original_mappings.append((original_node_id, simple_node_id))
+            nodes_found += 1
+
+        self.original_to_simple.update(new_original_mappings)
+
+        # Resolve edges now that every node in the file has been registered
         edges_found = 0
-        processed_edges = set()
-        
-        for pattern in edge_patterns:
-            for match in pattern.finditer(content):
-                source_original, target_original = match.groups()
-                
-                # Try to find nodes with file prefix first, then without
-                source_candidates = [f"{file_basename}::{source_original}", source_original]
-                target_candidates = [f"{file_basename}::{target_original}", target_original]
-                
-                source_simple = None
-                target_simple = None
-                
-                for src_candidate in source_candidates:
-                    if src_candidate in self.original_to_simple:
-                        source_simple = self.original_to_simple[src_candidate]
-                        break
-                
-                for tgt_candidate in target_candidates:
-                    if tgt_candidate in self.original_to_simple:
-                        target_simple = self.original_to_simple[tgt_candidate]
-                        break
-                
-                if source_simple and target_simple and source_simple != target_simple:
-                    edge = (source_simple, target_simple)
-                    # Check both edge directions for global deduplication
-                    reverse_edge = (target_simple, source_simple)
-                    if edge not in processed_edges and edge not in self.all_edges:
-                        self.all_edges.append(edge)
-                        processed_edges.add(edge)
-                        edges_found += 1
-        
+        adj_out = self.adj_out
+        adj_in = self.adj_in
+        lookup = self.original_to_simple.get
+        prefix = file_basename + '::'  # Hoisted out of the per-edge loop
+
+        for source_original, target_original in raw_edges:
+            # Try to find nodes with file prefix first, then without;
+            # simple IDs are always truthy so the or-chain is safe
+            source_simple = (lookup(prefix + source_original)
+                             or lookup(source_original))
+            target_simple = (lookup(prefix + target_original)
+                             or lookup(target_original))
+
+            if source_simple and target_simple and source_simple != target_simple:
+                targets = adj_out[source_simple]
+                if target_simple not in targets:
+                    targets[target_simple] = None
+                    adj_in[target_simple][source_simple] = None
+                    self.all_edges.append((source_simple, target_simple))
+                    edges_found += 1
+
         print(f"  Found {nodes_found} nodes, {edges_found} edges")
         if nodes_found == 0:
             print(f"  Note: This appears to be a dependency graph rather than a call graph")
@@ -1346,88 +1930,73 @@ DOT_CLEANUP            = NO
             return False
         
         print(f"\nProcessing {len(dot_files)} DOT files...")
-        
+
+        # Split off directory dependency graphs up front; only call graphs
+        # are parsed
+        parse_targets = []
         for dot_file in dot_files:
-            self.process_single_dot_file(dot_file)
-        
+            file_basename = os.path.basename(dot_file)
+            if 'dep.dot' in file_basename or 'dir_' in file_basename:
+                print(f"Processing: {file_basename}")
+                print(f"  Skipping directory dependency graph: {file_basename}")
+            else:
+                parse_targets.append(dot_file)
+
+        # Parsing each file is independent and CPU-bound, so farm it out to
+        # worker processes when there are enough files to pay for the pool;
+        # merging (dedup) stays single-threaded in submission order
+        if len(parse_targets) >= _PARALLEL_PARSE_MIN_FILES:
+            import concurrent.futures
+            with concurrent.futures.ProcessPoolExecutor() as pool:
+                for dot_file, result in zip(parse_targets,
+                                            pool.map(parse_dot_file, parse_targets, chunksize=8)):
+                    self.merge_parsed_file(dot_file, result)
+        else:
+            for dot_file in parse_targets:
+                self.merge_parsed_file(dot_file, parse_dot_file(dot_file))
+
+        # Dedup is enforced at insertion time (similar-node merging plus the
+        # edge set), so no trailing cleanup pass is needed
         print(f"\nCombined results:")
-        print(f"Total unique nodes: {len(self.simple_to_label)}")
+        print(f"Total unique nodes: {len(self.nodes)}")
         print(f"Total unique edges: {len(self.all_edges)}")
-        
-        # Final deduplication pass to ensure no duplicates remain
-        self.final_deduplication_pass()
-        
-        print(f"After final deduplication:")
-        print(f"Final unique nodes: {len(self.simple_to_label)}")
-        print(f"Final unique edges: {len(self.all_edges)}")
-        
-        return len(self.simple_to_label) > 0
-    
-    def final_deduplication_pass(self):
-        """Perform a final pass to remove any remaining duplicates"""
-        initial_edges = len(self.all_edges)
-        
-        # Remove duplicate edges (keep only unique edges)
-        unique_edges = []
-        seen_edges = set()
-        
-        for edge in self.all_edges:
-            source, target = edge
-            
-            # Only keep if we haven't seen this edge connection before
-            if edge not in seen_edges:
-                unique_edges.append(edge)
-                seen_edges.add(edge)
-        
-        removed_edges = initial_edges - len(unique_edges)
-        if removed_edges > 0:
-            print(f"  Removed {removed_edges} duplicate edges")
-        
-        self.all_edges = unique_edges
-        
-        # Clean up orphaned mappings
-        valid_node_ids = set(self.simple_to_label.keys())
-        
-        # Clean original_to_simple mapping
-        old_mapping_count = len(self.original_to_simple)
-        self.original_to_simple = {
-            orig_id: simple_id for orig_id, simple_id in self.original_to_simple.items()
-            if simple_id in valid_node_ids
-        }
-        cleaned_mappings = old_mapping_count - len(self.original_to_simple)
-        if cleaned_mappings > 0:
-            print(f"  Cleaned {cleaned_mappings} orphaned node mappings")
-        
-        # Clean file_sources mapping
-        self.file_sources = {
-            node_id: source for node_id, source in self.file_sources.items()
-            if node_id in valid_node_ids
-        }
-    
+
+        return len(self.nodes) > 0
+
     def calculate_hierarchical_layout(self):
         """Calculate positions for nodes in a hierarchical layout with minimal edge crossings and better visual flow"""
-        nodes = self.simple_to_label
-        edges = self.all_edges
-        
-        # Build adjacency lists
-        incoming = {node: [] for node in nodes}
-        outgoing = {node: [] for node in nodes}
-        
-        for source, target in edges:
-            if source in nodes and target in nodes:
-                outgoing[source].append(target)
-                incoming[target].append(source)
-        
+        nodes = self.nodes
+
+        # Adjacency is maintained at edge-insertion time (insertion-ordered
+        # target/source dicts per node), so no per-layout rebuild is needed
+        incoming = self.adj_in
+        outgoing = self.adj_out
+
+        # Degrees feed every sort key below; computed once instead of a
+        # len() per comparison
+        out_deg = {node: len(targets) for node, targets in outgoing.items()}
+        in_deg = {node: len(sources) for node, sources in incoming.items()}
+
+        # Per-node execution priority and category order, computed once so
+        # the O(N log N) sort comparisons below reduce to dict probes
+        exec_priority = {
+            node: self._label_priority(info.label)
+                  + min(20, out_deg[node] * 2) + min(10, in_deg[node])
+            for node, info in nodes.items()
+        }
+        category_order = {node: self.get_function_category_order(info.label)
+                          for node, info in nodes.items()}
+
         # Identify isolated nodes (not connected to anything)
         isolated_nodes = []
         connected_nodes = {}
-        
-        for node in nodes:
+
+        for node, info in nodes.items():
             if not incoming[node] and not outgoing[node]:
                 isolated_nodes.append(node)
             else:
-                connected_nodes[node] = nodes[node]
-        
+                connected_nodes[node] = info.label
+
         # Enhanced root finding based on program entry points and execution sequence
         roots = [node for node in connected_nodes if not incoming[node]]
         
@@ -1435,7 +2004,7 @@ DOT_CLEANUP            = NO
             # Look for program entry points with enhanced sequence logic
             entry_candidates = []
             for node in connected_nodes.keys():
-                node_label = connected_nodes[node].lower()
+                node_label = self.nodes[node].label_lower
                 priority = 0
                 
                 # Main function patterns (highest priority)
@@ -1470,30 +2039,33 @@ DOT_CLEANUP            = NO
                     priority = 1
                 
                 # Boost priority for nodes with many outgoing connections (likely orchestrators)
-                connectivity_boost = min(5, len(outgoing[node]))
+                connectivity_boost = min(5, out_deg[node])
                 priority += connectivity_boost
                 
                 entry_candidates.append((node, priority))
             
             if entry_candidates:
-                # Sort by priority, then by outgoing connections, then by incoming connections
-                entry_candidates.sort(key=lambda x: (x[1], len(outgoing[x[0]]), -len(incoming[x[0]])), reverse=True)
-                # Select top entry points, but limit to prevent too many roots
+                # Select top entry points by priority, then outgoing, then
+                # incoming connections; a partial selection beats sorting the
+                # whole candidate list for the handful of roots kept
                 max_roots = min(5, max(1, len(entry_candidates) // 10))
-                roots = [node for node, priority in entry_candidates[:max_roots]]
+                top = heapq.nlargest(
+                    max_roots, entry_candidates,
+                    key=lambda x: (x[1], out_deg[x[0]], -in_deg[x[0]]))
+                roots = [node for node, priority in top]
             else:
                 # Fall back to nodes with most outgoing connections
-                roots = sorted(connected_nodes.keys(), key=lambda x: len(outgoing[x]), reverse=True)[:3]
+                roots = sorted(connected_nodes.keys(), key=lambda x: out_deg[x], reverse=True)[:3]
         
         # Enhanced level assignment with execution sequence awareness
         levels = {}
         visited = set()
-        queue = [(root, 0) for root in roots]
+        queue = deque((root, 0) for root in roots)
         max_level = 0
-        
+
         # First pass: assign basic levels through BFS
         while queue:
-            node, level = queue.pop(0)
+            node, level = queue.popleft()
             if node in visited:
                 continue
             visited.add(node)
@@ -1504,9 +2076,7 @@ DOT_CLEANUP            = NO
             max_level = max(max_level, level)
             
             # Enhanced children sorting based on execution sequence patterns
-            children = sorted(outgoing[node], key=lambda x: self.get_execution_priority(
-                self.simple_to_label[x], len(outgoing[x]), len(incoming[x])
-            ), reverse=True)
+            children = sorted(outgoing[node], key=exec_priority.__getitem__, reverse=True)
             
             for child in children:
                 if child not in visited and child in connected_nodes:
@@ -1529,10 +2099,8 @@ DOT_CLEANUP            = NO
                     levels[node] = 0
         
         # Optimize level distribution to reduce crowding
-        level_groups = {}
+        level_groups = defaultdict(list)
         for node, level in levels.items():
-            if level not in level_groups:
-                level_groups[level] = []
             level_groups[level].append(node)
         
         # Redistribute overly crowded levels
@@ -1543,7 +2111,7 @@ DOT_CLEANUP            = NO
                 nodes_in_level = level_groups[level]
                 # Group by connectivity patterns
                 important_nodes = [n for n in nodes_in_level if len(outgoing[n]) > 1 or any(
-                    keyword in self.simple_to_label[n].lower() 
+                    keyword in self.nodes[n].label_lower 
                     for keyword in ['main', 'init', 'setup', 'create', 'start']
                 )]
                 regular_nodes = [n for n in nodes_in_level if n not in important_nodes]
@@ -1567,7 +2135,8 @@ DOT_CLEANUP            = NO
         max_node_width = 0
         max_node_height = 0
         
-        for node_id, label in nodes.items():
+        for node_id, info in nodes.items():
+            label = info.label
             is_isolated = node_id in isolated_nodes
             font_size = self.get_node_font_size(label, is_isolated)
             width, height = self.calculate_node_size(label, font_size, is_isolated)
@@ -1630,17 +2199,19 @@ DOT_CLEANUP            = NO
             
             # Enhanced sorting for better execution sequence within each level
             sorted_level_nodes = sorted(level_nodes, key=lambda x: (
-                -self.get_execution_priority(self.simple_to_label[x], len(outgoing[x]), len(incoming[x])),  # Execution priority first
-                -len(outgoing[x]),  # Functions that call many others (orchestrators) next
-                -len(incoming[x]),  # Popular functions (utilities) after that
-                self.get_function_category_order(self.simple_to_label[x]),  # Function type ordering
-                self.simple_to_label[x].lower()  # Alphabetical as final tiebreaker
+                -exec_priority[x],  # Execution priority first
+                -out_deg[x],  # Functions that call many others (orchestrators) next
+                -in_deg[x],  # Popular functions (utilities) after that
+                category_order[x],  # Function type ordering
+                self.nodes[x].label_lower  # Alphabetical as final tiebreaker
             ))
             
-            for i, node in enumerate(sorted_level_nodes):
-                x = start_x + i * node_spacing
-                y = 200 + level * level_spacing  # Increased top margin and spacing
-                positions[node] = (x, y)
+            # Row y is constant per level; assign the whole row in one batch
+            level_y = 200 + level * level_spacing  # Increased top margin and spacing
+            positions.update(
+                (node, (start_x + i * node_spacing, level_y))
+                for i, node in enumerate(sorted_level_nodes)
+            )
         
         # Position isolated nodes with enhanced organization and increased spacing
         if isolated_nodes:
@@ -1659,175 +2230,60 @@ DOT_CLEANUP            = NO
             isolated_spacing_x = max_node_width + 60  # Increased horizontal spacing based on max width
             isolated_spacing_y = max_node_height + 50  # Increased vertical spacing based on max height
             
-            # Enhanced organization of isolated nodes by execution sequence and type
+            # Enhanced organization of isolated nodes by execution sequence
+            # and type: rank comes from the cached single-scan tier lookup
             def get_isolated_node_priority(node):
-                label = self.simple_to_label[node].lower()
-                
-                # Priority order for isolated functions (higher = earlier in layout)
-                if any(keyword in label for keyword in ['main', '__main__', 'init', 'setup']):
-                    return (1, label)  # Critical functions first
-                elif any(keyword in label for keyword in ['config', 'configure', 'initialize']):
-                    return (2, label)  # Configuration functions
-                elif any(keyword in label for keyword in ['read', 'input', 'get']):
-                    return (3, label)  # Input functions
-                elif any(keyword in label for keyword in ['process', 'calculate', 'compute']):
-                    return (4, label)  # Processing functions
-                elif any(keyword in label for keyword in ['write', 'output', 'send']):
-                    return (5, label)  # Output functions
-                elif any(keyword in label for keyword in ['validate', 'check', 'verify']):
-                    return (6, label)  # Validation functions
-                elif any(keyword in label for keyword in ['timer', 'delay', 'wait']):
-                    return (7, label)  # Timing functions
-                elif any(keyword in label for keyword in ['update', 'modify', 'set']):
-                    return (8, label)  # Modification functions
-                elif any(keyword in label for keyword in ['save', 'store', 'persist']):
-                    return (9, label)  # Storage functions
-                elif any(keyword in label for keyword in ['cleanup', 'close', 'finalize']):
-                    return (10, label) # Cleanup functions
-                elif any(keyword in label for keyword in ['test', 'check', 'assert']):
-                    return (11, label) # Test functions
-                elif any(keyword in label for keyword in ['error', 'fail', 'exception']):
-                    return (12, label) # Error handling
-                elif any(keyword in label for keyword in ['helper', 'utility', 'util']):
-                    return (13, label) # Utility functions last
-                else:
-                    return (7, label)  # Default to middle priority
-            
+                label = self.nodes[node].label_lower
+                return (_isolated_priority(label), label)
+
             sorted_isolated = sorted(isolated_nodes, key=get_isolated_node_priority)
             
-            for i, node in enumerate(sorted_isolated):
-                col = i % isolated_cols
-                row = i // isolated_cols
-                x = isolated_start_x + col * isolated_spacing_x
-                y = 200 + row * isolated_spacing_y  # Match main graph start with increased spacing
-                positions[node] = (x, y)
+            # Match main graph start (y=200) with increased spacing
+            positions.update(
+                (node, (isolated_start_x + (i % isolated_cols) * isolated_spacing_x,
+                        200 + (i // isolated_cols) * isolated_spacing_y))
+                for i, node in enumerate(sorted_isolated)
+            )
         
         return positions, node_sizes, max_node_width, max_node_height, len(isolated_nodes), canvas_width
     
     def calculate_node_size(self, label, font_size=11, is_isolated=False):
         """Calculate optimal node size based on text content and font size"""
-        # Base character width estimation (pixels per character)
-        char_width_map = {
-            9: 5.5,   # Small font
-            10: 6.0,
-            11: 6.5,  # Default font
-            12: 7.0,  # Main function font
-            13: 7.5,
-            14: 8.0,
-            16: 9.0,
-        }
-        
-        char_width = char_width_map.get(font_size, 6.5)
+        # The arithmetic depends only on the label length, so identical
+        # (length, font, isolation) combinations hit the cache
+        return _node_size(len(label), font_size, is_isolated)
         
-        # Calculate text dimensions
-        text_width = len(label) * char_width
-        
-        # Minimum and maximum sizes
-        min_width = 100
-        max_width = 300
-        min_height = 50
-        max_height = 100
-        
-        # Calculate width with padding
-        padding_horizontal = 20
-        calculated_width = max(min_width, min(max_width, text_width + padding_horizontal))
-        
-        # Calculate height based on font size and potential line wrapping
-        padding_vertical = 20
-        line_height = font_size + 4  # Font size plus line spacing
-        
-        # Check if text needs wrapping
-        if text_width > (max_width - padding_horizontal):
-            # Multi-line text
-            lines_needed = max(1, int(text_width / (max_width - padding_horizontal)) + 1)
-            calculated_height = max(min_height, min(max_height, lines_needed * line_height + padding_vertical))
-        else:
-            # Single line text
-            calculated_height = max(min_height, line_height + padding_vertical)
-        
-        # Adjust for isolated nodes (slightly smaller)
-        if is_isolated:
-            calculated_width = max(min_width - 10, calculated_width - 10)
-            calculated_height = max(min_height - 5, calculated_height - 5)
-        
-        return int(calculated_width), int(calculated_height)
-    
     def get_node_font_size(self, label, is_isolated=False):
         """Get font size based on node type"""
-        label_lower = label.lower()
-        
         if is_isolated:
             return 10
-        elif any(pattern in label_lower for pattern in ['main', '__main__', 'main()', 'int main']):
-            return 12  # Main functions get larger font
-        elif any(keyword in label_lower for keyword in ['__init__', 'constructor', 'destructor', '~', 'setup', 'start', 'begin', 'run']):
-            return 11
-        elif any(keyword in label_lower for keyword in ['error', 'fail', 'exception', 'abort', 'throw', 'catch', 'except']):
-            return 11
-        elif any(keyword in label_lower for keyword in ['test', 'unittest', 'pytest', 'assert', 'check']):
-            return 10
-        else:
-            return 11  # Default font size
+
+        tiers = _node_style_tiers(label)
+        for tier, size in _FONT_SIZE_TIERS:
+            if tier in tiers:
+                return size
+        return 11  # Default font size
     
     def get_node_style(self, label, is_isolated=False, node_width=None, node_height=None):
         """Determine node style based on function type and characteristics with dynamic sizing"""
-        label_lower = label.lower()
         font_size = self.get_node_font_size(label, is_isolated)
-        
-        # Base style components
-        base_style = "rounded=1;whiteSpace=wrap;html=1;shadow=1;"
-        
+
         if is_isolated:
             color_style = "fillColor=#f8f9fa;strokeColor=#868e96;strokeWidth=1;dashed=1;fontColor=#495057;"
-        elif any(pattern in label_lower for pattern in ['main', '__main__', 'main()', 'int main']):
-            color_style = "fillColor=#ff6b6b;strokeColor=#e03131;fontStyle=1;fontColor=white;"
-        elif any(keyword in label_lower for keyword in ['__init__', 'constructor', 'destructor', '~', 'setup', 'start', 'begin', 'run']):
-            color_style = "fillColor=#51cf66;strokeColor=#37b24d;fontColor=white;"
-        elif any(keyword in label_lower for keyword in ['init', 'config', 'configure', 'initialize']):
-            color_style = "fillColor=#69db7c;strokeColor=#51cf66;fontColor=white;"
-        elif any(keyword in label_lower for keyword in ['error', 'fail', 'exception', 'abort', 'throw', 'catch', 'except']):
-            color_style = "fillColor=#ffd43b;strokeColor=#fab005;fontColor=#212529;"
-        elif any(keyword in label_lower for keyword in ['test', 'unittest', 'pytest', 'assert', 'check']):
-            color_style = "fillColor=#da77f2;strokeColor=#be4bdb;fontColor=white;"
-        elif any(keyword in label_lower for keyword in ['read', 'write', 'send', 'receive', 'transmit', 'input', 'output', 'print', 'cout', 'cin']):
-            color_style = "fillColor=#9775fa;strokeColor=#7950f2;fontColor=white;"
-        elif any(keyword in label_lower for keyword in ['timer', 'delay', 'wait', 'sleep', 'time', 'clock']):
-            color_style = "fillColor=#ff8787;strokeColor=#fd7e14;fontColor=white;"
-        elif any(keyword in label_lower for keyword in ['get', 'set', 'property', 'getter', 'setter', 'accessor']):
-            color_style = "fillColor=#38d9a9;strokeColor=#20c997;fontColor=white;"
         else:
-            color_style = "fillColor=#74c0fc;strokeColor=#339af0;fontColor=white;"
-        
-        font_style = f"fontSize={font_size};"
-        
-        return base_style + color_style + font_style
-        """Determine node style based on function type and characteristics"""
-        label_lower = label.lower()
-        
-        if is_isolated:
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#f8f9fa;strokeColor=#868e96;strokeWidth=1;dashed=1;fontColor=#495057;shadow=1;fontSize=11;"
-        elif any(pattern in label_lower for pattern in ['main', '__main__', 'main()', 'int main']):
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#ff6b6b;strokeColor=#e03131;fontStyle=1;fontColor=white;shadow=1;fontSize=12;"
-        elif any(keyword in label_lower for keyword in ['__init__', 'constructor', 'destructor', '~', 'setup', 'start', 'begin', 'run']):
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#51cf66;strokeColor=#37b24d;fontColor=white;shadow=1;fontSize=11;"
-        elif any(keyword in label_lower for keyword in ['init', 'config', 'configure', 'initialize']):
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#69db7c;strokeColor=#51cf66;fontColor=white;shadow=1;fontSize=11;"
-        elif any(keyword in label_lower for keyword in ['error', 'fail', 'exception', 'abort', 'throw', 'catch', 'except']):
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#ffd43b;strokeColor=#fab005;fontColor=#212529;shadow=1;fontSize=11;"
-        elif any(keyword in label_lower for keyword in ['test', 'unittest', 'pytest', 'assert', 'check']):
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#da77f2;strokeColor=#be4bdb;fontColor=white;shadow=1;fontSize=11;"
-        elif any(keyword in label_lower for keyword in ['read', 'write', 'send', 'receive', 'transmit', 'input', 'output', 'print', 'cout', 'cin']):
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#9775fa;strokeColor=#7950f2;fontColor=white;shadow=1;fontSize=11;"
-        elif any(keyword in label_lower for keyword in ['timer', 'delay', 'wait', 'sleep', 'time', 'clock']):
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#ff8787;strokeColor=#fd7e14;fontColor=white;shadow=1;fontSize=11;"
-        elif any(keyword in label_lower for keyword in ['get', 'set', 'property', 'getter', 'setter', 'accessor']):
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#38d9a9;strokeColor=#20c997;fontColor=white;shadow=1;fontSize=11;"
-        else:
-            return "rounded=1;whiteSpace=wrap;html=1;fillColor=#74c0fc;strokeColor=#339af0;fontColor=white;shadow=1;fontSize=11;"
+            tiers = _node_style_tiers(label)
+            for tier, style in _COLOR_STYLE_TIERS:
+                if tier in tiers:
+                    color_style = style
+                    break
+            else:
+                color_style = "fillColor=#74c0fc;strokeColor=#339af0;fontColor=white;"
+
+        return _node_style_string(color_style, font_size)
     
     def convert_to_drawio(self):
         """Convert the combined graph to Draw.io XML format"""
-        if not self.simple_to_label:
+        if not self.nodes:
             print("Error: No nodes found to convert")
             return False
         
@@ -1836,195 +2292,317 @@ DOT_CLEANUP            = NO
         
         # Calculate canvas dimensions with better proportions for nice flow charts and increased spacing
         total_levels = len(set(pos[1] for pos in node_positions.values())) if node_positions else 3
-        level_spacing = 320 if len(self.simple_to_label) > 30 else 280
+        level_spacing = 320 if len(self.nodes) > 30 else 280
         canvas_height = max(1400, 500 + total_levels * level_spacing + isolated_count * 120)
         
-        # Create the root mxfile element with enhanced metadata
-        mxfile = ET.Element('mxfile', 
-                           host="app.diagrams.net", 
-                           modified="2025-07-18T00:00:00.000Z", 
-                           agent="Doxygen-to-Drawio Converter v2.0", 
-                           etag="doxygen-generated-flowchart", 
-                           version="24.2.5")
-        diagram = ET.SubElement(mxfile, 'diagram', 
-                               name="Doxygen Function Flow Chart", 
-                               id="doxygen-flow-chart")
-        
         # Calculate dynamic values with better proportions and increased spacing
-        dx_value = str(max(2000, total_canvas_width // 2))
-        dy_value = str(max(1200, canvas_height // 2))
-        page_width = str(max(1800, total_canvas_width + 400))
-        page_height = str(max(1400, canvas_height + 400))
-        
-        graph_model = ET.SubElement(diagram, 'mxGraphModel', 
-                                   dx=dx_value, dy=dy_value, grid="1", gridSize="10", 
-                                   guides="1", tooltips="1", connect="1", 
-                                   arrows="1", fold="1", page="1", pageScale="1", 
-                                   pageWidth=page_width, pageHeight=page_height, 
-                                   math="0", shadow="0")
-        
-        root = ET.SubElement(graph_model, 'root')
-        
-        # Add default layers
-        ET.SubElement(root, 'mxCell', id="0")
-        layer1 = ET.SubElement(root, 'mxCell', id="1")
-        layer1.set('parent', '0')
-        
+        model_attrs = {
+            'dx': max(2000, total_canvas_width // 2),
+            'dy': max(1200, canvas_height // 2),
+            'grid': "1", 'gridSize': "10",
+            'guides': "1", 'tooltips': "1", 'connect': "1",
+            'arrows': "1", 'fold': "1", 'page': "1", 'pageScale': "1",
+            'pageWidth': max(1800, total_canvas_width + 400),
+            'pageHeight': max(1400, canvas_height + 400),
+            'math': "0", 'shadow': "0"}
+
+        cells = self._iter_cells(node_positions, node_sizes, max_node_width,
+                                 isolated_count, total_canvas_width)
+        try:
+            if self.safe_xml:
+                return self._write_drawio_tree(model_attrs, cells)
+            return self._write_drawio_text(model_attrs, cells)
+        except IOError as e:
+            print(f"Error writing to {self.output_file}: {e}")
+            return False
+
+    def _iter_cells(self, node_positions, node_sizes, max_node_width,
+                    isolated_count, total_canvas_width):
+        """Yield (cell_attrs, geometry_attrs, waypoints) for every mxCell in
+        document order; both serializers consume this one stream.
+        geometry_attrs is None for the bare layer cells, and waypoints is a
+        (possibly empty) point list only for edge cells"""
+        # Default layers
+        yield {'id': "0"}, None, None
+        yield {'id': "1", 'parent': "0"}, None, None
+
         # Add isolated nodes header with enhanced styling and increased spacing
         if isolated_count > 0:
             isolated_area_width = 700 if isolated_count > 15 else 550 if isolated_count > 5 else 400
             main_graph_width = total_canvas_width - isolated_area_width
             
             # Add a decorative background for isolated functions area with increased spacing
-            background_cell = ET.SubElement(root, 'mxCell',
-                                          id="isolated-background",
-                                          value="",
-                                          style="rounded=1;whiteSpace=wrap;html=1;fillColor=#f8f9fa;strokeColor=#dee2e6;strokeWidth=1;opacity=30;",
-                                          vertex="1")
-            background_cell.set('parent', '1')
-            
-            background_geometry = ET.SubElement(background_cell, 'mxGeometry',
-                                              x=str(main_graph_width + 80), y="140",
-                                              width=str(isolated_area_width - 80), 
-                                              height=str(max(700, isolated_count * 130)))
-            background_geometry.set('as', 'geometry')
-            
+            yield ({
+                'id': "isolated-background",
+                'value': "",
+                'style': "rounded=1;whiteSpace=wrap;html=1;fillColor=#f8f9fa;strokeColor=#dee2e6;strokeWidth=1;opacity=30;",
+                'vertex': "1",
+                'parent': "1"}, {
+                'x': main_graph_width + 80, 'y': "140",
+                'width': isolated_area_width - 80,
+                'height': max(700, isolated_count * 130),
+                'as': 'geometry'}, None)
+
             # Add "Isolated Functions" header with enhanced styling and increased spacing
-            header_cell = ET.SubElement(root, 'mxCell',
-                                       id="isolated-header",
-                                       value="🔧 Isolated Functions",
-                                       style="text;html=1;strokeColor=#495057;fillColor=#e9ecef;align=center;verticalAlign=middle;whiteSpace=wrap;rounded=1;fontSize=14;fontStyle=1;fontColor=#495057;strokeWidth=1;shadow=1;",
-                                       vertex="1")
-            header_cell.set('parent', '1')
-            
-            header_geometry = ET.SubElement(header_cell, 'mxGeometry',
-                                           x=str(main_graph_width + 120), y="150",
-                                           width="200", height="35")
-            header_geometry.set('as', 'geometry')
-            
+            yield ({
+                'id': "isolated-header",
+                'value': "🔧 Isolated Functions",
+                'style': "text;html=1;strokeColor=#495057;fillColor=#e9ecef;align=center;verticalAlign=middle;whiteSpace=wrap;rounded=1;fontSize=14;fontStyle=1;fontColor=#495057;strokeWidth=1;shadow=1;",
+                'vertex': "1",
+                'parent': "1"}, {
+                'x': main_graph_width + 120, 'y': "150",
+                'width': "200", 'height': "35",
+                'as': 'geometry'}, None)
+
             # Add a more subtle separator line with increased spacing
-            separator_cell = ET.SubElement(root, 'mxCell',
-                                         id="separator-line",
-                                         value="",
-                                         style="rounded=0;whiteSpace=wrap;html=1;fillColor=none;strokeColor=#adb5bd;strokeWidth=1;dashed=1;opacity=50;",
-                                         vertex="1")
-            separator_cell.set('parent', '1')
-            
-            separator_geometry = ET.SubElement(separator_cell, 'mxGeometry',
-                                             x=str(main_graph_width + 50), y="120",
-                                             width="2", height=str(max(700, isolated_count * 130)))
-            separator_geometry.set('as', 'geometry')
+            yield ({
+                'id': "separator-line",
+                'value': "",
+                'style': "rounded=0;whiteSpace=wrap;html=1;fillColor=none;strokeColor=#adb5bd;strokeWidth=1;dashed=1;opacity=50;",
+                'vertex': "1",
+                'parent': "1"}, {
+                'x': main_graph_width + 50, 'y': "120",
+                'width': "2", 'height': max(700, isolated_count * 130),
+                'as': 'geometry'}, None)
         
         # Add nodes with dynamic sizing
-        for node_id, label in self.simple_to_label.items():
+        adj_out = self.adj_out
+        adj_in = self.adj_in
+        get_node_style = self.get_node_style
+        for node_id, info in self.nodes.items():
+            label = info.label
             x, y = node_positions[node_id]
             node_width, node_height = node_sizes[node_id]
-            
-            # Escape HTML entities
-            safe_label = label.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-            
-            # Check if isolated
-            is_isolated = node_id not in [s for s, t in self.all_edges] and node_id not in [t for s, t in self.all_edges]
+
+            # Escape HTML entities in one pass
+            safe_label = label.translate(_XML_ESCAPE)
+
+            # Check if isolated - the adjacency maps make this O(1) per node
+            is_isolated = not adj_out[node_id] and not adj_in[node_id]
             
             # Get appropriate style with dynamic sizing
-            style = self.get_node_style(label, is_isolated, node_width, node_height)
-            
-            # Create node cell
-            node_cell = ET.SubElement(root, 'mxCell', 
-                                     id=node_id,
-                                     value=safe_label,
-                                     style=style,
-                                     vertex="1")
-            node_cell.set('parent', '1')
-            
-            # Add geometry with calculated size
-            geometry = ET.SubElement(node_cell, 'mxGeometry',
-                                   x=str(x), y=str(y),
-                                   width=str(node_width), height=str(node_height))
-            geometry.set('as', 'geometry')
-        
-        # Add edges with enhanced styling for better visual flow and collision avoidance
+            style = get_node_style(label, is_isolated, node_width, node_height)
+
+            # Node cell with its calculated size
+            yield ({
+                'id': node_id,
+                'value': safe_label,
+                'style': style,
+                'vertex': "1",
+                'parent': "1"}, {
+                'x': x, 'y': y,
+                'width': node_width, 'height': node_height,
+                'as': 'geometry'}, None)
+        
+        # Per-node connection coordinates, computed once up front: each node's
+        # center/extent arithmetic used to be redone for every incident edge,
+        # so a hub with 50 edges paid for the same sums 50 times
+        conn_coords = {}
+        for nid, (nx, ny) in node_positions.items():
+            nw, nh = node_sizes[nid]
+            conn_coords[nid] = (nx, ny, nx + nw // 2, nx + nw,
+                                ny + nh, ny + nh // 2)
+
+        # Add edges with enhanced styling for better visual flow and collision
+        # avoidance; bind the per-iteration attribute lookups once
         edge_counter = 1
+        coords_get = conn_coords.get
+        nodes = self.nodes
+        get_edge_style = self.get_edge_style
+        execution_waypoints = self._execution_waypoints
         for source_id, target_id in self.all_edges:
-            if source_id in node_positions and target_id in node_positions:
+            source_coords = coords_get(source_id)
+            target_coords = coords_get(target_id)
+            if source_coords is not None and target_coords is not None:
                 edge_id = f"edge-{edge_counter}"
-                
-                # Get node positions and sizes
-                source_x, source_y = node_positions[source_id]
-                target_x, target_y = node_positions[target_id]
-                source_width, source_height = node_sizes[source_id]
-                target_width, target_height = node_sizes[target_id]
-                
+
+                source_x, source_y, source_cx, source_right, source_bottom, source_my = source_coords
+                target_x, target_y, target_cx, target_right, target_bottom, target_my = target_coords
+
                 # Calculate connection points to avoid overlapping with node content
                 # Use bottom center of source and top center of target for downward flow
                 if target_y > source_y:  # Downward flow
-                    source_connection_x = source_x + source_width // 2
-                    source_connection_y = source_y + source_height
-                    target_connection_x = target_x + target_width // 2
+                    source_connection_x = source_cx
+                    source_connection_y = source_bottom
+                    target_connection_x = target_cx
                     target_connection_y = target_y
                 elif target_y < source_y:  # Upward flow
-                    source_connection_x = source_x + source_width // 2
+                    source_connection_x = source_cx
                     source_connection_y = source_y
-                    target_connection_x = target_x + target_width // 2
-                    target_connection_y = target_y + target_height
+                    target_connection_x = target_cx
+                    target_connection_y = target_bottom
                 else:  # Same level - use side connections
                     if target_x > source_x:  # Right-ward
-                        source_connection_x = source_x + source_width
-                        source_connection_y = source_y + source_height // 2
+                        source_connection_x = source_right
+                        source_connection_y = source_my
                         target_connection_x = target_x
-                        target_connection_y = target_y + target_height // 2
+                        target_connection_y = target_my
                     else:  # Left-ward
                         source_connection_x = source_x
-                        source_connection_y = source_y + source_height // 2
-                        target_connection_x = target_x + target_width
-                        target_connection_y = target_y + target_height // 2
-                
+                        source_connection_y = source_my
+                        target_connection_x = target_right
+                        target_connection_y = target_my
+
                 # Get function labels for styling decisions
-                source_label = self.simple_to_label[source_id].lower()
-                target_label = self.simple_to_label[target_id].lower()
-                
+                source_label = nodes[source_id].label_lower
+                target_label = nodes[target_id].label_lower
+
                 # Enhanced edge styling based on execution sequence and function relationships
-                style = self.get_edge_style(source_label, target_label, source_connection_x, source_connection_y, 
-                                          target_connection_x, target_connection_y)
-                
-                # Create edge cell
-                edge_cell = ET.SubElement(root, 'mxCell',
-                                        id=edge_id,
-                                        style=style,
-                                        edge="1",
-                                        source=source_id,
-                                        target=target_id)
-                edge_cell.set('parent', '1')
-                
-                # Add geometry with enhanced waypoints for execution flow
-                geometry = ET.SubElement(edge_cell, 'mxGeometry', relative="1")
-                geometry.set('as', 'geometry')
-                
-                # Add intelligent waypoints based on execution sequence patterns
-                self.add_execution_waypoints(geometry, source_connection_x, source_connection_y, 
-                                           target_connection_x, target_connection_y, 
-                                           source_label, target_label, max_node_width)
-                
+                style = get_edge_style(source_label, target_label, source_connection_x, source_connection_y,
+                                       target_connection_x, target_connection_y)
+
+                # Intelligent waypoints based on execution sequence patterns
+                waypoints = execution_waypoints(
+                    source_connection_x, source_connection_y,
+                    target_connection_x, target_connection_y,
+                    source_label, target_label, max_node_width)
+
+                # Edge cell with its relative geometry
+                yield ({
+                    'id': edge_id,
+                    'style': style,
+                    'edge': "1",
+                    'source': source_id,
+                    'target': target_id,
+                    'parent': "1"}, {
+                    'relative': "1", 'as': 'geometry'}, waypoints)
+
                 edge_counter += 1
-        
-        # Convert to formatted XML and write to file
-        rough_string = ET.tostring(mxfile, 'utf-8')
-        reparsed = minidom.parseString(rough_string)
-        pretty_xml = reparsed.toprettyxml(indent="  ")
-        
-        # Clean up formatting
-        lines = [line for line in pretty_xml.split('\n') if line.strip()]
-        pretty_xml = '\n'.join(lines)
-        
-        # Write to file
-        try:
-            with open(self.output_file, 'w', encoding='utf-8') as file:
-                file.write(pretty_xml)
+
+    def _write_drawio_text(self, model_attrs, cells):
+        """Serialize the cell stream straight to the file - no Element
+        objects, no attribute dict copies, no tree walk, and never more than
+        one cell plus the write buffer in memory.  Produces the same bytes
+        as the ElementTree path"""
+        with open(self.output_file, 'w', encoding='utf-8',
+                  buffering=1 << 20) as file:
+            write = file.write
+            write("<?xml version='1.0' encoding='utf-8'?>\n"
+                  f'<mxfile{_fmt_attrs(_MXFILE_ATTRS)}>\n'
+                  f'  <diagram{_fmt_attrs(_DIAGRAM_ATTRS)}>\n'
+                  f'    <mxGraphModel{_fmt_attrs(model_attrs)}>\n'
+                  '      <root>\n')
+            for attrs, geo_attrs, waypoints in cells:
+                if geo_attrs is None:
+                    write(f'        <mxCell{_fmt_attrs(attrs)} />\n')
+                elif waypoints:
+                    write(f'        <mxCell{_fmt_attrs(attrs)}>\n'
+                          f'          <mxGeometry{_fmt_attrs(geo_attrs)}>\n'
+                          '            <Array as="points">\n')
+                    for wx, wy in waypoints:
+                        write(f'              <mxPoint x="{wx}" y="{wy}" />\n')
+                    write('            </Array>\n'
+                          '          </mxGeometry>\n'
+                          '        </mxCell>\n')
+                else:
+                    write(f'        <mxCell{_fmt_attrs(attrs)}>\n'
+                          f'          <mxGeometry{_fmt_attrs(geo_attrs)} />\n'
+                          '        </mxCell>\n')
+            write('      </root>\n'
+                  '    </mxGraphModel>\n'
+                  '  </diagram>\n'
+                  '</mxfile>')
+        return True
+
+    def _write_drawio_tree(self, model_attrs, cells):
+        """--safe-xml fallback: build the document with ElementTree (or lxml
+        when available) and let the library handle every escaping corner"""
+        _load_etree()
+        mxfile = ET.Element('mxfile', dict(_MXFILE_ATTRS))
+        diagram = ET.SubElement(mxfile, 'diagram', dict(_DIAGRAM_ATTRS))
+        graph_model = ET.SubElement(diagram, 'mxGraphModel', _str_attrs(model_attrs))
+        root = ET.SubElement(graph_model, 'root')
+
+        # Build each cell standalone and bulk-extend the root once; the
+        # per-call parent bookkeeping of SubElement(root, ...) is skipped
+        # and the appends happen in one C-level loop
+        def build_cells():
+            for attrs, geo_attrs, waypoints in cells:
+                cell = ET.Element('mxCell', attrs)
+                if geo_attrs is not None:
+                    geometry = ET.SubElement(cell, 'mxGeometry', _str_attrs(geo_attrs))
+                    if waypoints:
+                        # The point list is a tiny fixed structure; templating
+                        # it as one string and parsing it once is cheaper than
+                        # per-point SubElement bookkeeping
+                        points = "".join(f'<mxPoint x="{x}" y="{y}"/>' for x, y in waypoints)
+                        geometry.append(ET.fromstring(f'<Array as="points">{points}</Array>'))
+                yield cell
+
+        root.extend(build_cells())
+
+        if _USING_LXML:
+            # lxml indents while serializing - no second parse needed
+            with open(self.output_file, 'wb') as file:
+                file.write(ET.tostring(mxfile, pretty_print=True,
+                                       xml_declaration=True, encoding='UTF-8'))
             return True
-        except IOError as e:
-            print(f"Error writing to {self.output_file}: {e}")
-            return False
+
+        # Indent in place and serialize straight to the file; no minidom
+        # DOM round-trip, so peak memory stays at one copy of the tree
+        if hasattr(ET, 'indent'):  # Python 3.9+
+            ET.indent(mxfile, space="  ")
+        else:
+            _indent_tree(mxfile)
+        ET.ElementTree(mxfile).write(self.output_file, encoding='utf-8',
+                                     xml_declaration=True)
+        return True
     
+    # Sidecar file (written next to the output) recording which inputs
+    # produced the last conversion
+    _CACHE_SIDECAR = '.doxygen2drawio_cache.json'
+
+    def _input_fingerprint(self):
+        """Hash of every DOT input's name, size and mtime, or None when the
+        inputs cannot be enumerated"""
+        import hashlib
+        digest = hashlib.blake2b(digest_size=16)
+        count = 0
+        try:
+            with os.scandir(self.doxygen_output_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.name.endswith('.dot') and entry.is_file():
+                        st = entry.stat()
+                        digest.update(f'{entry.name}\0{st.st_size}\0{st.st_mtime_ns}\n'.encode())
+                        count += 1
+        except OSError:
+            return None
+        return digest.hexdigest() if count else None
+
+    def _cache_sidecar_path(self):
+        return os.path.join(os.path.dirname(os.path.abspath(self.output_file)),
+                            self._CACHE_SIDECAR)
+
+    def _cached_output_fresh(self, fingerprint):
+        """Whether the sidecar matches this fingerprint and the recorded
+        output file still exists"""
+        import json
+        try:
+            with open(self._cache_sidecar_path(), 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if (cache.get('fingerprint') != fingerprint
+                or cache.get('output') != os.path.abspath(self.output_file)):
+            return False
+        try:
+            os.stat(self.output_file)
+        except OSError:
+            return False
+        return True
+
+    def _write_conversion_cache(self, fingerprint):
+        """Record the input fingerprint that produced the current output"""
+        if fingerprint is None:
+            return
+        import json
+        try:
+            with open(self._cache_sidecar_path(), 'w', encoding='utf-8') as f:
+                json.dump({'fingerprint': fingerprint,
+                           'output': os.path.abspath(self.output_file)}, f)
+        except OSError:
+            pass
+
     def convert(self):
         """Main conversion function with integrated Doxygen support"""
         print(Colors.colored("Doxygen to Draw.io Converter with Integrated Doxygen", Colors.BLUE))
@@ -2050,25 +2628,32 @@ DOT_CLEANUP            = NO
             
             return False
         
-        # Step 3: Combine all DOT files
-        if not self.combine_all_dot_files():
-            print(Colors.colored("Error: No valid nodes found in DOT files", Colors.RED))
-            
-            if not self.run_doxygen:
-                print(Colors.colored("\n💡 Try running with --run-doxygen to regenerate documentation", Colors.CYAN))
-            
-            return False
-        
-        # Step 4: Convert to Draw.io format
-        print(Colors.colored(f"\nConverting to Draw.io format...", Colors.YELLOW))
-        if not self.convert_to_drawio():
-            return False
-        
-        print(Colors.colored(f"\n✅ Draw.io file generated: {self.output_file}", Colors.GREEN))
-        print(Colors.colored(f"📊 Total nodes: {len(self.simple_to_label)}, Total edges: {len(self.all_edges)}", Colors.CYAN))
-        
-        if hasattr(self, 'file_sources'):
-            source_files = set(self.file_sources.values())
+        # Step 3: Reuse the previous output when every DOT input is unchanged
+        # since the last successful conversion - the rebuild is deterministic,
+        # so matching inputs mean a matching diagram
+        fingerprint = self._input_fingerprint()
+        if fingerprint is not None and self._cached_output_fresh(fingerprint):
+            print(Colors.colored(f"\n⚡ DOT files unchanged since last run - reusing {self.output_file}", Colors.GREEN))
+        else:
+            # Combine all DOT files
+            if not self.combine_all_dot_files():
+                print(Colors.colored("Error: No valid nodes found in DOT files", Colors.RED))
+
+                if not self.run_doxygen:
+                    print(Colors.colored("\n💡 Try running with --run-doxygen to regenerate documentation", Colors.CYAN))
+
+                return False
+
+            # Step 4: Convert to Draw.io format
+            print(Colors.colored(f"\nConverting to Draw.io format...", Colors.YELLOW))
+            if not self.convert_to_drawio():
+                return False
+            self._write_conversion_cache(fingerprint)
+
+            print(Colors.colored(f"\n✅ Draw.io file generated: {self.output_file}", Colors.GREEN))
+            print(Colors.colored(f"📊 Total nodes: {len(self.nodes)}, Total edges: {len(self.all_edges)}", Colors.CYAN))
+
+            source_files = set(info.file_source for info in self.nodes.values())
             print(Colors.colored(f"📁 Combined from {len(source_files)} DOT files", Colors.CYAN))
         
         # Step 5: Auto-open or prompt to open
@@ -2089,60 +2674,32 @@ DOT_CLEANUP            = NO
 
     def open_drawio_file(self):
         """Open the generated Draw.io file directly in the browser or app"""
+        import subprocess
+        import webbrowser
         if not os.path.exists(self.output_file):
             print(Colors.colored("Error: Draw.io file not found!", Colors.RED))
             return False
         
         abs_file_path = os.path.abspath(self.output_file)
-        system = sys.platform.lower()
-        
+
         try:
-            # Try to open with draw.io desktop app first (preferred method)
+            # The launcher table is resolved once per process; the first
+            # entry is the best available viewer for this platform
             desktop_app_opened = False
-            
-            if system == "darwin":  # macOS
-                try:
-                    subprocess.run(["open", "-a", "draw.io", abs_file_path], check=True, capture_output=True)
-                    print(Colors.colored(f"📱 Opened with draw.io desktop app", Colors.GREEN))
-                    desktop_app_opened = True
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    # draw.io desktop app not found, continue to try other methods
-                    pass
-                    
-            elif system.startswith("linux"):  # Linux
-                try:
-                    subprocess.run(["drawio", abs_file_path], check=True, capture_output=True)
+            for argv, use_shell, is_desktop_app in _drawio_launchers():
+                # Fire-and-forget: no pipes to allocate, nothing blocks on
+                # the viewer's startup, and the new session keeps it alive
+                # after this script exits
+                subprocess.Popen([*argv, abs_file_path], shell=use_shell,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
+                if is_desktop_app:
                     print(Colors.colored(f"📱 Opened with draw.io desktop app", Colors.GREEN))
-                    desktop_app_opened = True
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    # draw.io desktop app not found, continue to try other methods
-                    pass
-                    
-            elif system.startswith("win"):  # Windows
-                try:
-                    subprocess.run(["draw.io.exe", abs_file_path], check=True, capture_output=True)
-                    print(Colors.colored(f"� Opened with draw.io desktop app", Colors.GREEN))
-                    desktop_app_opened = True
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    # draw.io desktop app not found, continue to try other methods
-                    pass
-            
-            # If desktop app didn't work, try default application
-            if not desktop_app_opened:
-                try:
-                    if system == "darwin":  # macOS
-                        subprocess.run(["open", abs_file_path], check=True)
-                        print(Colors.colored(f"� Opened with default application", Colors.GREEN))
-                    elif system.startswith("linux"):  # Linux
-                        subprocess.run(["xdg-open", abs_file_path], check=True)
-                        print(Colors.colored(f"📁 Opened with default application", Colors.GREEN))
-                    elif system.startswith("win"):  # Windows
-                        subprocess.run(["start", abs_file_path], shell=True, check=True)
-                        print(Colors.colored(f"� Opened with default application", Colors.GREEN))
-                    desktop_app_opened = True
-                except (subprocess.CalledProcessError, FileNotFoundError):
-                    # Even default app failed
-                    pass
+                else:
+                    print(Colors.colored(f"📁 Opened with default application", Colors.GREEN))
+                desktop_app_opened = True
+                break
             
             # Only open web browser if local methods failed
             if not desktop_app_opened:
@@ -2211,6 +2768,8 @@ Examples:
                        help='Automatically open the generated Draw.io file')
     parser.add_argument('--no-prompt', action='store_true',
                        help='Skip the prompt to open the file')
+    parser.add_argument('--safe-xml', action='store_true',
+                       help='Build the output with ElementTree instead of the faster direct text emitter')
     
     # New Doxygen integration arguments
     parser.add_argument('--run-doxygen', action='store_true',
@@ -2259,7 +2818,8 @@ Examples:
         no_prompt=args.no_prompt,
         source_dir=os.path.abspath(args.source_dir),
         run_doxygen=args.run_doxygen,
-        dot_path=args.dot_path
+        dot_path=args.dot_path,
+        safe_xml=args.safe_xml
     )
     
     # Show configuration